@@ -15,12 +15,14 @@ else:
 # Expose globally so services can import it
 os.environ["ROMTOOL_BASE"] = BASE_PATH
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from main_window import MainWindow
-
 
 def main() -> None:
+    # Qt and the window module are imported here rather than at module scope
+    # so nothing heavy is loaded before BASE_PATH is exported above.
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    from main_window import MainWindow
+
     # High-DPI support (PySide6 >= 6.4 handles this automatically,
     # but we set the attribute for older 6.x builds just in case)
     QApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -35,7 +37,15 @@ def main() -> None:
     window = MainWindow()
     window.show()
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    # Release pooled connections held by whichever services were loaded.
+    for name in ("services.download_service", "services.search_service"):
+        service = sys.modules.get(name)
+        if service is not None:
+            service.close_client()
+
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -8,50 +8,70 @@ Layout
   ├───────────────────────────┬──────────────────────────┤
   │                           │  Mirror selection        │
   │  Game list                │  Format (XEX / GOD)      │
-  │  (QListWidget)            │  Destination + Browse    │
+  │  (QListView)              │  Destination + Browse    │
   │                           │  [Download & Convert]    │
   ├───────────────────────────┴──────────────────────────┤
-  │  Progress bar                                        │  ← BOTTOM
+  │  Current stage label                                 │  ← BOTTOM
+  │  Progress bar                                        │
   │  Status log (QPlainTextEdit, read-only)              │
   └──────────────────────────────────────────────────────┘
 """
 
 from __future__ import annotations
 
-import datetime
+import os
+import time
 from pathlib import Path
-from typing import List, Optional
-
-from PySide6.QtCore import Qt, QThread, Slot
-from PySide6.QtGui import QFont, QPalette, QColor, QIcon
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QItemSelection,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Slot,
+)
+from PySide6.QtGui import QColor, QFont, QIcon, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QButtonGroup,
-    QFileDialog,
-    QFrame,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
-    QMessageBox,
     QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QRadioButton,
-    QScrollArea,
-    QSizePolicy,
     QSplitter,
     QStatusBar,
     QVBoxLayout,
     QWidget,
-    QTextEdit,
 )
 
-from models.game_entry import GameEntry
-from services import search_service
-from workers.install_worker import InstallWorker
+from models.game_entry import GameEntry, MirrorLink
+
+# search_service and InstallWorker pull in httpx / bs4 and the whole service
+# layer; they are imported lazily where used so the window paints first.
+if TYPE_CHECKING:
+    from workers.install_worker import InstallWorker
+
+# Delay between the last keystroke and re-filtering the game list (ms).
+_SEARCH_DEBOUNCE_MS = 120
+
+# Installs run concurrently up to this many at a time. Each one is mostly
+# network / disk bound plus a single-threaded converter process.
+_MAX_PARALLEL_INSTALLS = min(os.cpu_count() or 1, 3)
+
+# Log lines are buffered and written to the log area at most once per frame.
+_LOG_FLUSH_MS = 16
 
 # ── Colour palette ─────────────────────────────────────────────────────────────
 _BG         = "#0f1117"
@@ -66,6 +86,9 @@ _WARNING    = "#ed8936"
 _ERROR      = "#fc8181"
 _BORDER     = "#2d3748"
 
+# Parsed once; the log flush reuses these instead of re-parsing hex strings.
+_QCOLOR_ERROR, _QCOLOR_SUCCESS, _QCOLOR_DIM = map(QColor, (_ERROR, _SUCCESS, _TEXT_DIM))
+
 _STYLESHEET = f"""
 QMainWindow, QWidget {{
     background-color: {_BG};
@@ -89,22 +112,24 @@ QLineEdit#searchBar:focus {{
 }}
 
 /* ── Game list ──────────────────────────────────────────────────────────── */
-QListWidget#gameList {{
+QListView#gameList {{
     background-color: {_BG2};
     border: 1px solid {_BORDER};
     border-radius: 6px;
     outline: none;
     padding: 4px;
+    font-family: 'Segoe UI';
+    font-size: 15px;
 }}
-QListWidget#gameList::item {{
+QListView#gameList::item {{
     padding: 8px 12px;
     border-radius: 4px;
 }}
-QListWidget#gameList::item:selected {{
+QListView#gameList::item:selected {{
     background-color: {_ACCENT};
     color: white;
 }}
-QListWidget#gameList::item:hover {{
+QListView#gameList::item:hover {{
     background-color: {_BG3};
 }}
 
@@ -190,6 +215,14 @@ QPushButton#downloadBtn:disabled {{
     color: {_TEXT_DIM};
 }}
 
+/* ── Selected games ─────────────────────────────────────────────────────── */
+QPlainTextEdit#selectedGames {{
+    background: #232323;
+    border-radius: 6px;
+    color: #E5E5E5;
+    font-size: 14px;
+}}
+
 /* ── Progress bar ───────────────────────────────────────────────────────── */
 QProgressBar {{
     background-color: {_BG2};
@@ -255,20 +288,37 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("ROMTool  ·  Xbox ISO Utility")
         self.setMinimumSize(1020, 700)
         self.resize(1200, 780)
+        # The whole window is styled from the single module-level sheet so Qt
+        # parses one stylesheet instead of one per styled child widget.
         self.setStyleSheet(_STYLESHEET)
         # Define fonte padrão para toda a janela
         self.setFont(QFont('Segoe UI', 12))
 
         # State
         self._catalogue: List[GameEntry] = []
-        self._filtered: List[GameEntry] = []
-        self._worker: Optional[InstallWorker] = None
+        # Source-model rows of the selected games, in selection order (the
+        # dict is used as an ordered set).
+        self._selected_rows: Dict[int, None] = {}
+        self._workers: List[InstallWorker] = []
+        # Cancelled jobs still winding down; kept referenced until done().
+        self._cancelled_workers: List[InstallWorker] = []
+        self._catalogue_signals = _CatalogueSignals(self)
+        self._catalogue_job: Optional[_CatalogueLoader] = None
+        self._jobs_remaining = 0
+        # Outcome of each job in the current batch, reported once it is over.
+        self._installed_paths: List[str] = []
+        self._job_errors: List[str] = []
+        self._job_progress: Dict[object, Tuple[float, float]] = {}
+        self._job_stage_msg: Dict[object, str] = {}
+        self._install_pool = QThreadPool(self)
+        self._install_pool.setMaxThreadCount(_MAX_PARALLEL_INSTALLS)
         self._selected_profile = "aggressive"  # default
 
         self._build_ui()
         self._connect_signals()
         self._set_status("Loading catalogue...")
-        self._on_load_catalogue()
+        # Start the fetch from the event loop so the window paints first.
+        QTimer.singleShot(0, self._on_load_catalogue)
 
     # ── UI construction ───────────────────────────────────────────────────────
 
@@ -291,6 +341,11 @@ class MainWindow(QMainWindow):
         self._search_bar.setMinimumHeight(40)
         self._search_bar.setFont(QFont('Segoe UI', 15))
 
+        # Typing restarts this timer; the list is only rebuilt once it fires.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+
         self._load_btn = QPushButton("⟳  Refresh List")
         self._load_btn.setFixedHeight(40)
         self._load_btn.setMinimumWidth(140)
@@ -298,7 +353,6 @@ class MainWindow(QMainWindow):
 
         # Engrenagem + Dropdown de perfil
         from PySide6.QtWidgets import QComboBox, QToolButton, QMenu
-        from PySide6.QtGui import QIcon
         self._profile_btn = QToolButton()
         self._profile_btn.setIcon(QIcon.fromTheme("emblem-system"))
         self._profile_btn.setToolTip("Configurações de Download")
@@ -326,12 +380,22 @@ class MainWindow(QMainWindow):
         splitter.setHandleWidth(4)
 
         # Left – Game Browser (Table)
-        self._game_list = QListWidget()
+        # Filtering runs in Qt's proxy model rather than rebuilding items.
+        self._game_model = _GameListModel(self)
+        self._game_proxy = QSortFilterProxyModel(self)
+        self._game_proxy.setSourceModel(self._game_model)
+        self._game_proxy.setFilterRole(_TITLE_ROLE)
+        # Titles are pre-lowered on GameEntry, so match case-sensitively
+        # against a lowered query instead of case-folding every row.
+        self._game_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+
+        self._game_list = QListView()
         self._game_list.setObjectName("gameList")
         self._game_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._game_list.setMinimumWidth(600)
-        self._game_list.setStyleSheet("font-size: 15px; font-family: 'Segoe UI';")
-        self._game_list.setSelectionMode(QListWidget.MultiSelection)
+        self._game_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        self._game_list.setUniformItemSizes(True)
+        self._game_list.setModel(self._game_proxy)
         splitter.addWidget(self._game_list)
 
         # Right – Action Sidebar
@@ -389,18 +453,12 @@ class MainWindow(QMainWindow):
         dest_layout.addLayout(path_row)
         layout.addWidget(dest_group)
 
-        # ── Selected Games List ────────────────────────────────────────────
         # ── Selected Games Container ────────────────────────────────────────
-        selected_group = QGroupBox("Selected Games")
-        selected_layout = QVBoxLayout(selected_group)
-        selected_layout.setSpacing(4)
-        self._selected_games_list = QTextEdit()
-        self._selected_games_list.setReadOnly(True)
-        self._selected_games_list.setStyleSheet("color: #E5E5E5; background: #232323; border-radius: 6px; font-size: 14px;")
-        self._selected_games_list.setMinimumHeight(80)
-        self._selected_games_list.setMaximumHeight(120)
-        selected_layout.addWidget(self._selected_games_list)
-        layout.addWidget(selected_group)
+        # Built on the first selection (see _ensure_selected_games_box); only
+        # its slot in the layout is reserved here.
+        self._sidebar_layout = layout
+        self._selected_games_index = layout.count()
+        self._selected_games_list: Optional[QPlainTextEdit] = None
 
         # ── Download button ────────────────────────────────────────────────
         self._download_btn = QPushButton("Download & Convert")
@@ -412,10 +470,28 @@ class MainWindow(QMainWindow):
         layout.addStretch()
         return w
 
+    def _ensure_selected_games_box(self) -> None:
+        if self._selected_games_list is not None:
+            return
+        selected_group = QGroupBox("Selected Games")
+        selected_layout = QVBoxLayout(selected_group)
+        selected_layout.setSpacing(4)
+        self._selected_games_list = QPlainTextEdit()
+        self._selected_games_list.setReadOnly(True)
+        self._selected_games_list.setObjectName("selectedGames")
+        self._selected_games_list.setMinimumHeight(80)
+        self._selected_games_list.setMaximumHeight(120)
+        selected_layout.addWidget(self._selected_games_list)
+        self._sidebar_layout.insertWidget(self._selected_games_index, selected_group)
+
     def _build_bottom(self) -> QVBoxLayout:
         layout = QVBoxLayout()
         layout.setSpacing(4)
 
+        self._stage_label = QLabel("")
+        self._stage_label.setObjectName("stageLabel")
+        layout.addWidget(self._stage_label)
+
         self._progress_bar = QProgressBar()
         self._progress_bar.setRange(0, 100)
         self._progress_bar.setValue(0)
@@ -431,15 +507,27 @@ class MainWindow(QMainWindow):
         self._log_area.setFixedHeight(140)
         layout.addWidget(self._log_area)
 
+        self._log_queue: List[Tuple[QColor, str]] = []  # (colour, line)
+        self._ts_second = -1
+        self._ts_text = ""
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         return layout
 
     # ── Signal wiring ─────────────────────────────────────────────────────────
 
     def _connect_signals(self) -> None:
         self._search_bar.textChanged.connect(self._on_search_changed)
+        self._search_timer.timeout.connect(self._apply_search)
         self._load_btn.clicked.connect(self._on_load_catalogue)
-        self._game_list.itemSelectionChanged.connect(self._on_selected_games_changed)
-        self._game_list.currentItemChanged.connect(self._on_game_selected)
+        self._catalogue_signals.finished.connect(self._on_catalogue_loaded)
+        self._catalogue_signals.error.connect(self._on_catalogue_error)
+        selection = self._game_list.selectionModel()
+        selection.selectionChanged.connect(self._on_selection_changed)
+        selection.currentChanged.connect(self._on_game_selected)
         self._browse_btn.clicked.connect(self._on_browse)
         self._download_btn.clicked.connect(self._on_download)
         self._profile_combo.currentIndexChanged.connect(self._on_profile_changed)
@@ -447,13 +535,28 @@ class MainWindow(QMainWindow):
     def _on_profile_changed(self, idx):
         self._selected_profile = self._profile_combo.currentData()
         self._set_status(f"Perfil de download: {self._profile_combo.currentText()}")
+    @Slot(QItemSelection, QItemSelection)
+    def _on_selection_changed(
+        self, selected: QItemSelection, deselected: QItemSelection
+    ) -> None:
+        # Apply only the delta instead of re-scanning the whole selection.
+        for index in deselected.indexes():
+            self._selected_rows.pop(self._game_proxy.mapToSource(index).row(), None)
+        for index in selected.indexes():
+            self._selected_rows[self._game_proxy.mapToSource(index).row()] = None
+        self._on_selected_games_changed()
+
     def _on_selected_games_changed(self):
-        selected_items = self._game_list.selectedItems()
-        if not selected_items:
-            self._selected_games_list.setText("Nenhum jogo selecionado.")
+        selected = self._selected_entries()
+        if self._selected_games_list is None:
+            if not selected:
+                return
+            self._ensure_selected_games_box()
+        if not selected:
+            self._selected_games_list.setPlainText("Nenhum jogo selecionado.")
         else:
-            titles = [item.data(Qt.ItemDataRole.UserRole).title for item in selected_items]
-            self._selected_games_list.setText("\n".join(titles))
+            titles = [entry.title for entry in selected]
+            self._selected_games_list.setPlainText("\n".join(titles))
 
     # ── Slots ─────────────────────────────────────────────────────────────────
 
@@ -461,20 +564,20 @@ class MainWindow(QMainWindow):
     def _on_load_catalogue(self) -> None:
         self._log("Loading catalogue…")
         self._load_btn.setEnabled(False)
-        self._game_list.clear()
+        self._game_model.set_entries([])
+        self._resync_selection()
         self._set_status("Fetching catalogue…")
         self._progress_bar.setFormat("Loading catalogue…")
         self._progress_bar.setRange(0, 0)  # indeterminate
 
-        # Run in a simple QThread to avoid blocking the UI.
-        self._catalogue_worker = _CatalogueLoader(self)
-        self._catalogue_worker.finished.connect(self._on_catalogue_loaded)
-        self._catalogue_worker.error.connect(self._on_catalogue_error)
-        self._catalogue_worker.start()
+        # Run on a pooled thread to avoid blocking the UI.
+        self._catalogue_job = _CatalogueLoader(self._catalogue_signals)
+        QThreadPool.globalInstance().start(self._catalogue_job)
 
     @Slot(object)
     def _on_catalogue_loaded(self, entries: List[GameEntry]) -> None:
         self._catalogue = entries
+        self._game_model.set_entries(entries)
         self._progress_bar.setRange(0, 100)
         self._progress_bar.setValue(0)
         self._progress_bar.setFormat("Idle")
@@ -485,6 +588,8 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def _on_catalogue_error(self, msg: str) -> None:
+        from PySide6.QtWidgets import QMessageBox
+
         self._progress_bar.setRange(0, 100)
         self._progress_bar.setValue(0)
         self._progress_bar.setFormat("Idle")
@@ -495,14 +600,14 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def _on_search_changed(self, text: str) -> None:
-        self._apply_search()
+        self._search_timer.start()
 
     @Slot()
     def _on_game_selected(self) -> None:
-        item = self._game_list.currentItem()
-        if item is None:
+        index = self._game_list.currentIndex()
+        if not index.isValid():
             return
-        entry: GameEntry = item.data(Qt.ItemDataRole.UserRole)
+        entry: GameEntry = index.data(Qt.ItemDataRole.UserRole)
         self._log(f"Selected: {entry.title}")
         self._set_status(f"Selected: {entry.title}")
 
@@ -514,6 +619,8 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_browse(self) -> None:
+        from PySide6.QtWidgets import QFileDialog
+
         folder = QFileDialog.getExistingDirectory(
             self, "Select Install Directory", self._dest_path.text() or ""
         )
@@ -523,6 +630,8 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_download(self) -> None:
+        from PySide6.QtWidgets import QMessageBox
+
         dest = self._dest_path.text().strip()
         fmt = "GOD" if self._god_radio.isChecked() else "XEX"
 
@@ -534,8 +643,8 @@ class MainWindow(QMainWindow):
 
         install_dir = Path(dest)
 
-        selected_items = self._game_list.selectedItems()
-        if not selected_items:
+        selected_entries = self._selected_entries()
+        if not selected_entries:
             QMessageBox.warning(self, "No Games Selected", "Selecione ao menos um jogo para instalar.")
             return
 
@@ -543,7 +652,7 @@ class MainWindow(QMainWindow):
         self._set_busy(True)
         self._progress_bar.setValue(0)
         self._progress_bar.setFormat("Starting…")
-        self._log(f"Iniciando instalação de {len(selected_items)} jogos [{fmt}] para: {install_dir}")
+        self._log(f"Iniciando instalação de {len(selected_entries)} jogos [{fmt}] para: {install_dir}")
 
         self._download_btn.setText("Cancel Download")
         self._download_btn.clicked.disconnect()
@@ -551,54 +660,128 @@ class MainWindow(QMainWindow):
 
         # Removido botão de pausar
 
-        def process_next(index):
-            if index >= len(selected_items):
-                self._set_busy(False)
-                self._progress_bar.setRange(0, 100)
-                self._progress_bar.setValue(100)
-                self._progress_bar.setFormat("Complete ✓")
-                self._download_btn.setText("Download & Convert")
-                self._download_btn.clicked.disconnect()
-                self._download_btn.clicked.connect(self._on_download)
-                pass  # Removido botão de pausar
-                return
-            item = selected_items[index]
-            entry = item.data(Qt.ItemDataRole.UserRole)
-            self._log(f"Instalando: {entry.title}")
-            from models.game_entry import MirrorLink
+        from workers.install_worker import InstallWorker
+
+        # Queue every job up front; the pool runs a few of them at a time.
+        self._workers = []
+        self._job_progress = {}
+        self._job_stage_msg = {}
+        self._jobs_remaining = len(selected_entries)
+        self._installed_paths = []
+        self._job_errors = []
+        for entry in selected_entries:
             mirror = MirrorLink(label=entry.title, url=entry.detail_url)
             worker = InstallWorker(
                 mirror=mirror,
-                install_dir=Path(dest),
+                install_dir=install_dir,
                 fmt=fmt,
                 profile=self._selected_profile,
-                parent=self
             )
-            self._worker = worker
             worker.progress.connect(self._on_progress)
+            worker.stage.connect(self._on_worker_stage)
             worker.status.connect(self._on_worker_status)
-            worker.finished.connect(lambda path: (self._on_worker_finished(path), process_next(index + 1)))
-            worker.error.connect(lambda msg: (self._on_worker_error(msg), process_next(index + 1)))
-            worker.start()
-        self._set_busy(True)
-        self._progress_bar.setValue(0)
-        self._progress_bar.setFormat("Starting…")
-        process_next(0)
+            worker.finished.connect(self._on_worker_finished)
+            worker.error.connect(self._on_worker_error)
+            worker.done.connect(self._on_install_job_done)
+            self._workers.append(worker)
+            self._install_pool.start(worker)
+
+    @Slot()
+    def _on_install_job_done(self) -> None:
+        # Only queued or running jobs stay listed, for a later cancel.
+        sender = self.sender()
+        self._workers = [w for w in self._workers if w.signals is not sender]
+        self._jobs_remaining -= 1
+        if self._jobs_remaining > 0:
+            return
+        self._workers = []
+        self._set_busy(False)
+        self._stage_label.clear()
+        self._download_btn.setText("Download & Convert")
+        self._download_btn.clicked.disconnect()
+        self._download_btn.clicked.connect(self._on_download)
+        self._show_batch_summary()
+
+    def _show_batch_summary(self) -> None:
+        """Final progress bar state and one dialog for the whole batch."""
+        from PySide6.QtWidgets import QMessageBox
+
+        installed, errors = self._installed_paths, self._job_errors
+        self._progress_bar.setRange(0, 100)
+        if not errors:
+            self._progress_bar.setValue(100)
+            self._progress_bar.setFormat("Complete ✓")
+            self._set_status("Installation complete.")
+            if len(installed) == 1:
+                text = f"Installation complete!\n\nFiles installed to:\n{installed[0]}"
+            else:
+                text = f"{len(installed)} games installed:\n\n" + "\n".join(installed)
+            QMessageBox.information(self, "Done", text)
+            return
+
+        self._progress_bar.setValue(100 if installed else 0)
+        self._progress_bar.setFormat("Completed with errors" if installed else "Error")
+        self._set_status("Error – see log.")
+        if len(errors) == 1 and not installed:
+            QMessageBox.critical(self, "Error", errors[0])
+        else:
+            QMessageBox.warning(
+                self,
+                "Completed with errors",
+                f"{len(installed)} installed, {len(errors)} failed.\n\n"
+                + "\n\n".join(errors),
+            )
 
     def _on_cancel_download(self):
-        if self._worker:
-            self._worker.cancel()
+        # Drop jobs that haven't started and cancel every one already running
+        # (up to _MAX_PARALLEL_INSTALLS).  Their completion must not count
+        # against a batch started afterwards.
+        for worker in self._workers:
+            self._disconnect_worker(worker)
+            if not self._install_pool.tryTake(worker):
+                worker.cancel()
+                self._cancelled_workers.append(worker)
+                worker.done.connect(self._on_cancelled_job_done)
+        self._workers = []
+        self._jobs_remaining = 0
+        self._job_progress = {}
+        self._job_stage_msg = {}
+        self._log("Installation cancelled.")
         self._set_busy(False)
         self._progress_bar.setFormat("Cancelado")
+        self._stage_label.clear()
         self._download_btn.setText("Download & Convert")
         self._download_btn.clicked.disconnect()
         self._download_btn.clicked.connect(self._on_download)
         pass  # Removido botão de pausar
 
+    def _disconnect_worker(self, worker: InstallWorker) -> None:
+        """Stop a cancelled job's signals from reaching the window."""
+        worker.progress.disconnect(self._on_progress)
+        worker.stage.disconnect(self._on_worker_stage)
+        worker.status.disconnect(self._on_worker_status)
+        worker.finished.disconnect(self._on_worker_finished)
+        worker.error.disconnect(self._on_worker_error)
+        worker.done.disconnect(self._on_install_job_done)
+
+    @Slot()
+    def _on_cancelled_job_done(self) -> None:
+        sender = self.sender()
+        self._cancelled_workers = [
+            w for w in self._cancelled_workers if w.signals is not sender
+        ]
+
     # Removido método de pausar download
 
     @Slot(int, int)
     def _on_progress(self, done: int, total: int) -> None:
+        # Several installs may report at once; show their combined progress.
+        self._job_progress[self.sender()] = (done, total)
+        if all(t > 0 for _, t in self._job_progress.values()):
+            done = sum(d for d, _ in self._job_progress.values())
+            total = sum(t for _, t in self._job_progress.values())
+        else:
+            total = 0
         if total > 0:
             pct = min(int(done * 100 / total), 100)
             self._progress_bar.setRange(0, 100)
@@ -610,45 +793,59 @@ class MainWindow(QMainWindow):
             self._progress_bar.setRange(0, 0)
             self._progress_bar.setFormat("Downloading…")
 
+    @Slot(dict)
+    def _on_worker_stage(self, event: dict) -> None:
+        self._stage_label.setText(
+            f"{event['stage'].capitalize()} ({event['pct']}%)  ·  {event['msg']}"
+        )
+        # Conversion progress repeats the step's message; log each step once.
+        if self._job_stage_msg.get(self.sender()) != event["msg"]:
+            self._job_stage_msg[self.sender()] = event["msg"]
+            self._log(event["msg"])
+            self._set_status(event["msg"])
+
     @Slot(str)
     def _on_worker_status(self, msg: str) -> None:
         self._log(msg)
         self._set_status(msg)
 
+    # Other jobs may still be running: these only record the outcome, the
+    # batch is wrapped up in _on_install_job_done.
+
     @Slot(str)
     def _on_worker_finished(self, path: str) -> None:
-        self._set_busy(False)
-        self._progress_bar.setRange(0, 100)
-        self._progress_bar.setValue(100)
-        self._progress_bar.setFormat("Complete ✓")
+        self._installed_paths.append(path)
         self._log(f"✓ Installed successfully: {path}", success=True)
-        self._set_status("Installation complete.")
-        QMessageBox.information(
-            self,
-            "Done",
-            f"Installation complete!\n\nFiles installed to:\n{path}",
-        )
+        self._set_status(f"Installed: {path}")
 
     @Slot(str)
     def _on_worker_error(self, msg: str) -> None:
-        self._set_busy(False)
-        self._progress_bar.setRange(0, 100)
-        self._progress_bar.setValue(0)
-        self._progress_bar.setFormat("Error")
+        self._job_errors.append(msg)
         self._log(f"✗ {msg}", error=True)
         self._set_status("Error – see log.")
-        QMessageBox.critical(self, "Error", msg)
 
     # ── UI helpers ────────────────────────────────────────────────────────────
 
     def _apply_search(self) -> None:
-        query = self._search_bar.text()
-        self._filtered = search_service.search(self._catalogue, query)
-        self._game_list.clear()
-        for entry in self._filtered:
-            item = QListWidgetItem(str(entry))
-            item.setData(Qt.ItemDataRole.UserRole, entry)
-            self._game_list.addItem(item)
+        self._game_proxy.setFilterFixedString(self._search_bar.text().strip().lower())
+        # Rows hidden by the filter drop out of the selection without a
+        # selectionChanged signal, so rebuild the set explicitly.
+        self._resync_selection()
+
+    def _resync_selection(self) -> None:
+        """Rebuild the selected-row set from the view after a reset/filter."""
+        live = {
+            self._game_proxy.mapToSource(index).row()
+            for index in self._game_list.selectionModel().selectedRows()
+        }
+        self._selected_rows = {
+            row: None for row in self._selected_rows if row in live
+        }
+        self._selected_rows.update(dict.fromkeys(live))
+        self._on_selected_games_changed()
+
+    def _selected_entries(self) -> List[GameEntry]:
+        return [self._catalogue[row] for row in self._selected_rows]
 
     # Mirrors removed
 
@@ -665,34 +862,107 @@ class MainWindow(QMainWindow):
         self._status_bar.showMessage(msg)
 
     def _log(self, msg: str, *, error: bool = False, success: bool = False) -> None:
-        ts = datetime.datetime.now().strftime("%H:%M:%S")
+        ts = self._timestamp()
         if error:
-            prefix = f'<span style="color:{_ERROR}">[{ts}] ✗  {msg}</span>'
+            entry = (_QCOLOR_ERROR, f"[{ts}] ✗  {msg}")
         elif success:
-            prefix = f'<span style="color:{_SUCCESS}">[{ts}] ✓  {msg}</span>'
+            entry = (_QCOLOR_SUCCESS, f"[{ts}] ✓  {msg}")
         else:
-            prefix = f'<span style="color:{_TEXT_DIM}">[{ts}]  {msg}</span>'
-        self._log_area.appendHtml(prefix)
+            entry = (_QCOLOR_DIM, f"[{ts}]  {msg}")
+        self._log_queue.append(entry)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _timestamp(self) -> str:
+        """HH:MM:SS for now, formatted at most once per wall-clock second."""
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._ts_text
+
+    @Slot()
+    def _flush_log(self) -> None:
+        """Write all queued log lines as coloured plain text in one pass."""
+        queue, self._log_queue = self._log_queue, []
+        doc = self._log_area.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        fmt = QTextCharFormat()
+        cursor.beginEditBlock()
+        for colour, line in queue:
+            if not doc.isEmpty():
+                cursor.insertBlock()
+            fmt.setForeground(colour)
+            cursor.insertText(line, fmt)
+        cursor.endEditBlock()
         # Scroll to bottom.
         sb = self._log_area.verticalScrollBar()
         sb.setValue(sb.maximum())
 
 
+# ── Game list model ───────────────────────────────────────────────────────────
+
+# Role the proxy filters on: the bare lowercased title, so region/size don't
+# match queries.
+_TITLE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class _GameListModel(QAbstractListModel):
+    """Read-only list model over the loaded catalogue."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._entries: List[GameEntry] = []
+
+    def set_entries(self, entries: List[GameEntry]) -> None:
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(entry)
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        if role == _TITLE_ROLE:
+            return entry.title_lower
+        return None
+
+
 # ── Lightweight helper workers (catalogue loading) ───────────────────────────
 
 from PySide6.QtCore import Signal as _Signal  # noqa: E402
 
 
-class _CatalogueLoader(QThread):
+class _CatalogueSignals(QObject):
     finished = _Signal(object)
     error = _Signal(str)
 
+
+class _CatalogueLoader(QRunnable):
+    """One-shot catalogue fetch; results are reported through *signals*."""
+
+    def __init__(self, signals: _CatalogueSignals) -> None:
+        super().__init__()
+        # MainWindow holds the reference; see InstallWorker for the rationale.
+        self.setAutoDelete(False)
+        self._signals = signals
+
     def run(self) -> None:
+        from services import search_service
+
         try:
             entries = search_service.fetch_catalogue()
-            self.finished.emit(entries)
+            self._signals.finished.emit(entries)
         except Exception as exc:
-            self.error.emit(str(exc))
+            self._signals.error.emit(str(exc))
 
 
     # Mirrors removed
@@ -17,20 +17,30 @@ class GameEntry:
     detail_url  : Absolute URL to the game's detail / mirror page.
     region      : Optional region tag parsed from the catalogue (e.g. "NTSC").
     size_hint   : Optional size string parsed from the catalogue (e.g. "7.8 GB").
+
+    The list label and the lowercased title used by search are computed once
+    at construction and cached in ``_display`` / ``title_lower``; the entry
+    is immutable so neither can go stale.
     """
 
     title: str
     detail_url: str
     region: str = ""
     size_hint: str = ""
+    title_lower: str = field(init=False, repr=False, compare=False)
+    _display: str = field(init=False, repr=False, compare=False)
 
-    def __str__(self) -> str:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title_lower", self.title.lower())
         parts = [self.title]
         if self.region:
             parts.append(f"[{self.region}]")
         if self.size_hint:
             parts.append(f"({self.size_hint})")
-        return "  ".join(parts)
+        object.__setattr__(self, "_display", "  ".join(parts))
+
+    def __str__(self) -> str:
+        return self._display
 
 
 @dataclass
@@ -13,8 +13,12 @@ Security notes
 * The working directory is always set to a controlled temp folder.
 """
 
+import functools
 import os
+import re
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Callable, Literal, Optional
 
@@ -25,11 +29,27 @@ from services.exceptions import ConversionError
 ConversionFormat = Literal["XEX", "GOD"]
 ProgressCallback = Callable[[int, int], None]  # (current, total)
 
+# ── Configuration ────────────────────────────────────────────────────────────
+
+SUBPROCESS_TIMEOUT: float = 3600.0  # 1-hour hard limit for very large ISOs
+
+# Percentage tokens in exiso / iso2god progress output, e.g. "  42%".
+_PERCENT_RE = re.compile(r"(\d{1,3})%")
+
+# Lines of tool output kept for error reporting; the rest is discarded.
+_OUTPUT_TAIL_LINES: int = 64
+
 # ── Binary resolution ────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=8)
 def _bin_path(name: str) -> Path:
-    """Resolve a bundled binary (exiso.exe / iso2god.exe) from BASE_PATH."""
+    """
+    Resolve a bundled binary (exiso.exe / iso2god.exe) from BASE_PATH.
+
+    Successful lookups are cached: BASE_PATH is fixed once main.py starts.
+    A missing binary raises and is therefore re-checked on the next call.
+    """
     base = Path(os.environ.get("ROMTOOL_BASE", os.path.abspath(".")))
     candidate = base / "bin" / name
     if not candidate.exists():
@@ -40,6 +60,18 @@ def _bin_path(name: str) -> Path:
     return candidate
 
 
+# ── Tool invocations ─────────────────────────────────────────────────────────
+
+# Per format: (binary name, argv template). "{iso}" and "{out}" are replaced
+# with the source ISO and output directory; everything else is literal.
+_CMD_TEMPLATES = {
+    # exiso.exe -d <output_dir> <iso_path>  – extract XEX content from the ISO.
+    "XEX": ("exiso.exe", ("-d", "{out}", "{iso}")),
+    # iso2god.exe <iso_path> <output_dir> --trim  – Games-On-Demand container.
+    # --trim reduces output size by removing padding; safe for all Xbox 360 ISOs.
+    "GOD": ("iso2god.exe", ("{iso}", "{out}", "--trim")),
+}
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 
@@ -70,105 +102,106 @@ def convert_iso(
     ------
     ConversionError on any subprocess error or missing binary.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    if fmt == "XEX":
-        return _convert_xex(iso_path, output_dir, progress_callback)
-    elif fmt == "GOD":
-        return _convert_god(iso_path, output_dir, progress_callback)
-    else:
-        raise ConversionError(f"Unknown conversion format: {fmt!r}")
-
-
-# ── Private converters ────────────────────────────────────────────────────────
-
-
-def _convert_xex(
-    iso_path: Path,
-    output_dir: Path,
-    cb: Optional[ProgressCallback],
-) -> Path:
-    """
-    Run exiso.exe to extract XEX content from the ISO.
+    try:
+        bin_name, arg_template = _CMD_TEMPLATES[fmt]
+    except KeyError:
+        raise ConversionError(f"Unknown conversion format: {fmt!r}") from None
 
-    Expected invocation:
-        exiso.exe -d <output_dir> <iso_path>
-    """
-    exiso = _bin_path("exiso.exe")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    binary = str(_bin_path(bin_name))
 
-    if cb:
-        cb(0, 100)
+    if progress_callback:
+        progress_callback(0, 100)
 
-    cmd = [str(exiso), "-d", str(output_dir), str(iso_path)]
-    _run_subprocess(cmd, label="exiso.exe")
+    subs = {"{iso}": str(iso_path), "{out}": str(output_dir)}
+    cmd = [binary, *[subs.get(arg, arg) for arg in arg_template]]
+    _run_subprocess(cmd, label=bin_name, cb=progress_callback)
 
-    if cb:
-        cb(100, 100)
+    if progress_callback:
+        progress_callback(100, 100)
 
-    # exiso typically creates a subdirectory named after the game inside output_dir.
-    # Return output_dir; caller can inspect its contents.
+    # exiso typically creates a subdirectory named after the game inside
+    # output_dir; iso2god writes its container there. Return output_dir;
+    # caller can inspect its contents.
     return output_dir
 
 
-def _convert_god(
-    iso_path: Path,
-    output_dir: Path,
-    cb: Optional[ProgressCallback],
-) -> Path:
-    """
-    Run iso2god.exe to produce a Games-On-Demand container.
-
-    Expected invocation:
-        iso2god.exe <iso_path> <output_dir> [--trim]
-    """
-    iso2god = _bin_path("iso2god.exe")
-
-    if cb:
-        cb(0, 100)
-
-    # --trim reduces output size by removing padding; safe for all Xbox 360 ISOs.
-    cmd = [str(iso2god), str(iso_path), str(output_dir), "--trim"]
-    _run_subprocess(cmd, label="iso2god.exe")
-
-    if cb:
-        cb(100, 100)
-
-    return output_dir
+# ── Private helpers ──────────────────────────────────────────────────────────
 
 
-def _run_subprocess(cmd: list, label: str) -> None:
+def _run_subprocess(
+    cmd: list, label: str, cb: Optional[ProgressCallback] = None
+) -> None:
     """
     Execute *cmd* via subprocess with security and error handling.
 
+    Output is read line by line as the tool runs (text mode also splits on
+    the carriage returns of in-place progress output): percentage tokens are
+    forwarded to *cb* and only the last few lines are kept for the error
+    message, so a long conversion never buffers its whole log in memory.
+
     Raises
     ------
     ConversionError if the process exits non-zero or cannot be launched.
     """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            # Tool output is in the console code page, not necessarily
+            # UTF-8; a stray byte must not abort the conversion.
+            errors="replace",
+            bufsize=1,
             shell=False,  # Never use shell=True with user-derived data
-            timeout=3600,  # 1-hour hard limit for very large ISOs
         )
     except FileNotFoundError as exc:
         raise ConversionError(
             f"{label} executable not found at the expected path. "
             "Ensure it exists in the bin/ directory."
         ) from exc
-    except subprocess.TimeoutExpired as exc:
-        raise ConversionError(
-            f"{label} exceeded the 1-hour time limit and was terminated."
-        ) from exc
     except OSError as exc:
         raise ConversionError(f"OS error launching {label}: {exc}") from exc
 
-    if result.returncode != 0:
-        stderr_snippet = (result.stderr or "")[:500]
-        stdout_snippet = (result.stdout or "")[:500]
+    # select() doesn't work on pipes under Windows, so the time limit is
+    # enforced by a watchdog that kills the process instead.
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(SUBPROCESS_TIMEOUT, _kill)
+    watchdog.daemon = True
+    watchdog.start()
+
+    tail: deque = deque(maxlen=_OUTPUT_TAIL_LINES)
+    last_pct = -1
+    try:
+        with proc:
+            for line in proc.stdout:
+                tail.append(line)
+                if cb is None:
+                    continue
+                match = _PERCENT_RE.search(line)
+                if match:
+                    pct = min(int(match.group(1)), 100)
+                    if pct != last_pct:
+                        last_pct = pct
+                        cb(pct, 100)
+    finally:
+        watchdog.cancel()
+
+    if timed_out.is_set():
+        raise ConversionError(
+            f"{label} exceeded the {SUBPROCESS_TIMEOUT:.0f} s time limit and was "
+            "terminated."
+        )
+
+    if proc.returncode != 0:
+        output_snippet = "".join(tail)[-1000:]
         raise ConversionError(
-            f"{label} exited with code {result.returncode}.\n"
-            f"STDOUT: {stdout_snippet}\n"
-            f"STDERR: {stderr_snippet}"
+            f"{label} exited with code {proc.returncode}.\n"
+            f"OUTPUT: {output_snippet}"
         )
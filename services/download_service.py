@@ -1,14 +1,181 @@
+"""
+services/download_service.py – Streaming file download with progress callbacks.
+
+Uses httpx in streaming mode so large ISO files are never loaded fully into
+memory.  A progress callback (bytes_downloaded, total_bytes_or_-1) is called
+periodically so the UI can update its progress bar.
+
+All downloads share one pooled httpx.Client, so consecutive files (and
+retries) from the same mirror host reuse the open TCP/TLS connection.
+"""
+
+import errno
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, TypeVar
+
+import httpx
+
+from services.exceptions import DownloadError
+
+# ── Configuration ────────────────────────────────────────────────────────────
+CHUNK_SIZE: int = 1024 * 1024  # 1 MiB – write buffer size for downloads
+CONNECT_TIMEOUT: float = 30.0
+MAX_RETRIES: int = 3
+RETRY_BACKOFF_BASE: float = 1.0  # seconds; doubles after each failed attempt
+# progress_callback fires at most this often, or after this many new bytes.
+PROGRESS_INTERVAL: float = 0.1  # seconds
+PROGRESS_MIN_BYTES: int = 8 * CHUNK_SIZE
+# Segmented downloads: connections per file, and the smallest segment worth
+# its own connection (smaller files are fetched over a single stream).
+DEFAULT_SEGMENTS: int = 4
+MIN_SEGMENT_SIZE: int = 16 * CHUNK_SIZE
+MAX_CONNECTIONS: int = 32
+MAX_KEEPALIVE_CONNECTIONS: int = 16
+KEEPALIVE_EXPIRY: float = 30.0
+
+# ── Types ────────────────────────────────────────────────────────────────────
+ProgressCallback = Callable[[int, int], None]
+_T = TypeVar("_T")
+
+# ── Shared client ────────────────────────────────────────────────────────────
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the process-wide download client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=httpx.Timeout(
+                    connect=CONNECT_TIMEOUT, read=None, write=None, pool=None
+                ),
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                follow_redirects=True,
+            )
+        return _client
+
+
+def close_client() -> None:
+    """Close the shared client and its pooled connections (call on shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+def _filename_from_headers(headers: httpx.Headers) -> Optional[str]:
+    """Extract filename from Content-Disposition header if present."""
+    cd = headers.get("content-disposition", "")
+    if not cd:
+        return None
+    # e.g.  attachment; filename="game.iso"
+    for part in cd.split(";"):
+        part = part.strip()
+        if part.lower().startswith("filename="):
+            name = part[len("filename="):].strip().strip('"').strip("'")
+            return name or None
+    return None
+
+def _filename_from_url(url: str) -> str:
+    """Derive a filename from the last path segment of the URL."""
+    from urllib.parse import urlparse, unquote
+    parsed = urlparse(url)
+    name = unquote(parsed.path.split("/")[-1])
+    return name if name else "download.bin"
+
+
+def _start_from_content_range(value: str) -> int:
+    """Parse the first byte from 'bytes 100-999/1000'; -1 if absent."""
+    start = value.partition(" ")[2].partition("-")[0].strip()
+    return int(start) if start.isdigit() else -1
+
+
+def _total_from_content_range(value: str) -> int:
+    """Parse the full size from 'bytes 100-999/1000' (or 'bytes */1000')."""
+    total = value.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else -1
+
+
+def _advise_sequential(fh) -> None:
+    """Tell the kernel *fh* is accessed front to back (POSIX only; no-op on Windows)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+def _preallocate(fh, size: int) -> None:
+    """
+    Reserve *size* bytes for *fh* up front.
+
+    posix_fallocate gives the file contiguous extents and fails with ENOSPC
+    before any data is fetched; elsewhere (Windows) the file is just
+    extended, which NTFS allocates on write.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fh.fileno(), 0, size)
+            return
+        except OSError as exc:
+            # Filesystems without fallocate support report EOPNOTSUPP/EINVAL.
+            if exc.errno == errno.ENOSPC:
+                raise
+    fh.truncate(size)
+
+
+class _ResumeState:
+    """What a retry needs to continue the previous attempt's partial file."""
+
+    def __init__(self) -> None:
+        self.dest_path: Optional[Path] = None
+        self.validator: Optional[str] = None  # ETag or Last-Modified
+
+
 def _attempt_download(
     url: str,
     dest_dir: Path,
     progress_callback: Optional[ProgressCallback],
     filename_override: Optional[str],
     cancel_event: Optional[object],
+    resume: _ResumeState,
 ) -> Path:
-    timeout = httpx.Timeout(connect=CONNECT_TIMEOUT, read=None, write=None, pool=None)
+    headers = {}
+    existing = 0
+    if resume.dest_path is not None and resume.dest_path.exists():
+        existing = resume.dest_path.stat().st_size
+    if existing:
+        headers["Range"] = f"bytes={existing}-"
+        if resume.validator:
+            # Server falls back to a full 200 response if the file changed.
+            headers["If-Range"] = resume.validator
 
     try:
-        with httpx.stream("GET", url, timeout=timeout, follow_redirects=True) as resp:
+        with _get_client().stream("GET", url, headers=headers) as resp:
+            if existing and resp.status_code == 416:
+                # Nothing left to fetch if the partial file is already whole.
+                full = _total_from_content_range(resp.headers.get("content-range", ""))
+                if full == existing:
+                    return resume.dest_path
+                # Partial file is longer than the resource; start over next time.
+                resume.dest_path.unlink(missing_ok=True)
             try:
                 resp.raise_for_status()
             except httpx.HTTPStatusError as exc:
@@ -16,22 +183,50 @@ def _attempt_download(
                     f"Server returned HTTP {exc.response.status_code} for URL: {url}"
                 ) from exc
 
-            filename = (
-                filename_override
-                or _filename_from_headers(resp.headers)
-                or _filename_from_url(url)
-                or "download.bin"
-            )
-            # Sanitise filename – strip path components.
-            filename = Path(filename).name
+            if resume.dest_path is not None:
+                dest_path = resume.dest_path
+            else:
+                filename = (
+                    filename_override
+                    or _filename_from_headers(resp.headers)
+                    or _filename_from_url(url)
+                    or "download.bin"
+                )
+                # Sanitise filename – strip path components.
+                filename = Path(filename).name
+                dest_path = dest_dir / filename
+                resume.dest_path = dest_path
+            content_range = resp.headers.get("content-range", "")
+            if existing and resp.status_code == 206:
+                if _start_from_content_range(content_range) != existing:
+                    # Appending a range that starts elsewhere would corrupt
+                    # the file; drop it so the retry fetches it whole.
+                    dest_path.unlink(missing_ok=True)
+                    raise DownloadError(
+                        f"Server resumed at the wrong offset "
+                        f"({content_range!r}, expected byte {existing:,})."
+                    )
+                mode = "ab"
+                downloaded = existing
+                total_bytes = _total_from_content_range(content_range)
+            else:
+                # Fresh download, or the server ignored Range: start over,
+                # validating later resumes against this copy of the file.
+                mode = "wb"
+                downloaded = 0
+                total_bytes = int(resp.headers.get("content-length", -1))
+                resume.validator = resp.headers.get("etag") or resp.headers.get(
+                    "last-modified"
+                )
 
-            dest_path = dest_dir / filename
-
-            total_bytes = int(resp.headers.get("content-length", -1))
-            downloaded = 0
-
-            with open(dest_path, "wb") as fh:
-                for chunk in resp.iter_bytes(chunk_size=CHUNK_SIZE):
+            # Take body pieces as httpx decodes them: asking it for fixed-size
+            # chunks makes it join and re-slice every MiB (two extra copies).
+            # The CHUNK_SIZE write buffer still batches them into large writes.
+            last_emit_time = time.monotonic()
+            last_emit_bytes = downloaded
+            with open(dest_path, mode, buffering=CHUNK_SIZE) as fh:
+                _advise_sequential(fh)
+                for chunk in resp.iter_bytes():
                     if cancel_event and cancel_event.is_set():
                         fh.close()
                         if dest_path.exists():
@@ -42,7 +237,22 @@ def _attempt_download(
                     fh.write(chunk)
                     downloaded += len(chunk)
                     if progress_callback:
-                        progress_callback(downloaded, total_bytes)
+                        now = time.monotonic()
+                        if (
+                            now - last_emit_time >= PROGRESS_INTERVAL
+                            or downloaded - last_emit_bytes >= PROGRESS_MIN_BYTES
+                        ):
+                            progress_callback(downloaded, total_bytes)
+                            last_emit_time = now
+                            last_emit_bytes = downloaded
+
+            if progress_callback and downloaded != last_emit_bytes:
+                progress_callback(downloaded, total_bytes)
+
+            if total_bytes > 0 and downloaded < total_bytes:
+                raise DownloadError(
+                    f"Connection closed after {downloaded:,} of {total_bytes:,} bytes."
+                )
 
     except httpx.RequestError as exc:
         raise DownloadError(f"Network error during download: {exc}") from exc
@@ -50,7 +260,105 @@ def _attempt_download(
         raise DownloadError(f"I/O error writing download to disk: {exc}") from exc
 
     return dest_path
+
+
+class _SharedProgress:
+    """Thread-safe, throttled byte counter shared by concurrent segments."""
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback]) -> None:
+        self._lock = threading.Lock()
+        self._total = total
+        self._callback = callback
+        self._done = 0
+        self._last_emit_time = time.monotonic()
+        self._last_emit_bytes = 0
+
+    def add(self, n: int) -> None:
+        with self._lock:
+            self._done += n
+            if self._callback is None:
+                return
+            now = time.monotonic()
+            if (
+                now - self._last_emit_time >= PROGRESS_INTERVAL
+                or self._done - self._last_emit_bytes >= PROGRESS_MIN_BYTES
+            ):
+                self._emit(now)
+
+    def finish(self) -> None:
+        with self._lock:
+            if self._callback is not None and self._done != self._last_emit_bytes:
+                self._emit(time.monotonic())
+
+    def _emit(self, now: float) -> None:
+        self._callback(self._done, self._total)
+        self._last_emit_time = now
+        self._last_emit_bytes = self._done
+
+
+def _download_segment(
+    url: str,
+    dest_path: Path,
+    start: int,
+    end: int,
+    validator: Optional[str],
+    progress: _SharedProgress,
+    stop: threading.Event,
+) -> None:
+    """
+    Fetch bytes [start, end] of *url* into the same range of *dest_path*.
+
+    Retries continue from the last byte written. Returns early, leaving the
+    segment incomplete, once *stop* is set.
+    """
+    offset = start
+    last_error: Optional[Exception] = None
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        headers = {"Range": f"bytes={offset}-{end}"}
+        if validator:
+            headers["If-Range"] = validator
+        try:
+            with _get_client().stream("GET", url, headers=headers) as resp:
+                if resp.status_code != 206:
+                    # Either ranges stopped working or If-Range saw a changed
+                    # file; a 200 here would be the whole file, not our range.
+                    raise DownloadError(
+                        f"Server answered a range request with HTTP "
+                        f"{resp.status_code} for URL: {url}"
+                    )
+                with open(dest_path, "r+b", buffering=CHUNK_SIZE) as fh:
+                    fh.seek(offset)
+                    for chunk in resp.iter_bytes():
+                        if stop.is_set():
+                            return
+                        chunk = chunk[: end + 1 - offset]
+                        fh.write(chunk)
+                        offset += len(chunk)
+                        progress.add(len(chunk))
+                        if offset > end:
+                            return
+            last_error = DownloadError(
+                f"Connection closed at byte {offset:,} of segment {start:,}-{end:,}."
+            )
+        except httpx.RequestError as exc:
+            last_error = DownloadError(f"Network error during download: {exc}")
+        except DownloadError as exc:
+            last_error = exc
+        except OSError as exc:
+            raise DownloadError(
+                f"I/O error writing download to disk: {exc}"
+            ) from exc
+
+        if attempt < MAX_RETRIES and stop.wait(RETRY_BACKOFF_BASE * 2 ** (attempt - 1)):
+            return
+
+    raise last_error
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
+
+
 def download_file(
     url: str,
     dest_dir: Path,
@@ -62,6 +370,9 @@ def download_file(
     """
     Stream-download *url* into *dest_dir*.
 
+    A failed attempt keeps its partial file; the retry asks the server for
+    the remaining bytes only (HTTP Range) and starts over if it refuses.
+
     Parameters
     ----------
     url               : Direct download URL.
@@ -76,79 +387,266 @@ def download_file(
     Path to the downloaded file.
 
     Raises
-        if progress_callback:
-            progress_callback(0, -1)
     ------
     DownloadError on any network or I/O failure.
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     last_error: Optional[Exception] = None
+    resume = _ResumeState()
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             return _attempt_download(
-                url, dest_dir, progress_callback, filename_override, cancel_event
+                url, dest_dir, progress_callback, filename_override, cancel_event,
+                resume,
             )
         except DownloadError as exc:
             last_error = exc
+            if cancel_event and cancel_event.is_set():
+                raise
             if attempt < MAX_RETRIES:
-                # Clean up any partial file before retrying.
-                _cleanup_partial(dest_dir, filename_override or _filename_from_url(url))
+                delay = RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
+                if cancel_event:
+                    # Event.wait doubles as an interruptible sleep.
+                    cancel_event.wait(delay)
+                else:
+                    time.sleep(delay)
             continue
 
     raise DownloadError(
         f"Download failed after {MAX_RETRIES} attempts. Last error: {last_error}"
     ) from last_error
-"""
-services/download_service.py – Streaming file download with progress callbacks.
 
-Uses httpx in streaming mode so large ISO files are never loaded fully into
-memory.  A progress callback (bytes_downloaded, total_bytes_or_-1) is called
-periodically so the UI can update its progress bar.
-"""
 
-import os
-from pathlib import Path
-from typing import Callable, Optional
+def download_file_segmented(
+    url: str,
+    dest_dir: Path,
+    *,
+    segments: int = DEFAULT_SEGMENTS,
+    progress_callback: Optional[ProgressCallback] = None,
+    filename_override: Optional[str] = None,
+    cancel_event: Optional[object] = None,
+) -> Path:
+    """
+    Download *url* over up to *segments* parallel HTTP Range connections.
 
-import httpx
+    Each connection writes its own byte range of the preallocated file, so
+    mirrors that cap per-connection throughput are no longer the ceiling.
+    Falls back to download_file() when the server doesn't support ranges,
+    doesn't report a size, or the file is too small to be worth splitting.
 
-from services.exceptions import DownloadError
+    Parameters and return value are as for download_file(), plus:
 
-# ── Configuration ────────────────────────────────────────────────────────────
-CHUNK_SIZE: int = 1024 * 1024  # 1 MiB
-CONNECT_TIMEOUT: float = 30.0
-MAX_RETRIES: int = 3
+    segments : Maximum number of concurrent connections for this file.
 
-# ── Types ────────────────────────────────────────────────────────────────────
-ProgressCallback = Callable[[int, int], None]
+    Raises
+    ------
+    DownloadError on any network or I/O failure.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
 
-def _filename_from_headers(headers: httpx.Headers) -> Optional[str]:
-    """Extract filename from Content-Disposition header if present."""
-    cd = headers.get("content-disposition", "")
-    if not cd:
-        return None
-    # e.g.  attachment; filename="game.iso"
-    for part in cd.split(";"):
-        part = part.strip()
-        if part.lower().startswith("filename="):
-            name = part[len("filename="):].strip().strip('"').strip("'")
-            return name or None
-    return None
+    # A one-byte range request tells us the size and whether ranges work.
+    # Only the status and headers are read: a server that ignores Range
+    # answers with the whole file, and its body must not be downloaded here.
+    try:
+        with _get_client().stream(
+            "GET", url, headers={"Range": "bytes=0-0"}
+        ) as probe:
+            pass
+    except httpx.RequestError as exc:
+        raise DownloadError(f"Network error during download: {exc}") from exc
 
-def _filename_from_url(url: str) -> str:
-    """Derive a filename from the last path segment of the URL."""
-    from urllib.parse import urlparse, unquote
-    parsed = urlparse(url)
-    name = unquote(parsed.path.split("/")[-1])
-    return name if name else "download.bin"
+    total = -1
+    if probe.status_code == 206:
+        total = _total_from_content_range(probe.headers.get("content-range", ""))
+    count = min(segments, total // MIN_SEGMENT_SIZE) if total > 0 else 0
+    if count < 2:
+        return download_file(
+            url,
+            dest_dir,
+            progress_callback=progress_callback,
+            filename_override=filename_override,
+            cancel_event=cancel_event,
+        )
 
+    filename = (
+        filename_override
+        or _filename_from_headers(probe.headers)
+        or _filename_from_url(url)
+        or "download.bin"
+    )
+    # Sanitise filename – strip path components.
+    dest_path = dest_dir / Path(filename).name
+    validator = probe.headers.get("etag") or probe.headers.get("last-modified")
 
-def _cleanup_partial(dest_dir: Path, filename: str) -> None:
-    partial = dest_dir / filename
     try:
-        if partial.exists():
-            partial.unlink()
-    except OSError:
-        pass
+        with open(dest_path, "wb") as fh:
+            _preallocate(fh, total)
+    except OSError as exc:
+        try:
+            dest_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise DownloadError(f"I/O error writing download to disk: {exc}") from exc
+
+    size = -(-total // count)  # ceil
+    ranges = [(lo, min(lo + size, total) - 1) for lo in range(0, total, size)]
+    progress = _SharedProgress(total, progress_callback)
+    stop = threading.Event()
+
+    def _watch_cancel() -> None:
+        # Relay the caller's cancel request to the segment threads.
+        while not stop.wait(0.2):
+            if cancel_event.is_set():
+                stop.set()
+
+    if cancel_event is not None:
+        threading.Thread(target=_watch_cancel, daemon=True).start()
+
+    error: Optional[DownloadError] = None
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        futures = [
+            pool.submit(
+                _download_segment, url, dest_path, lo, hi, validator, progress, stop
+            )
+            for lo, hi in ranges
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except DownloadError as exc:
+                # First failure stops the other segments.
+                error = error or exc
+                stop.set()
+    cancelled = cancel_event is not None and cancel_event.is_set()
+    stop.set()
+
+    if cancelled or error is not None:
+        try:
+            dest_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        if cancelled:
+            raise DownloadError("Download cancelled by user.")
+        raise DownloadError(f"Segmented download failed: {error}") from error
+
+    progress.finish()
+    return dest_path
+
+
+class _ResponseReader(io.RawIOBase):
+    """Read-only file object over a response body, counting progress."""
+
+    def __init__(
+        self,
+        resp: httpx.Response,
+        progress: _SharedProgress,
+        cancel_event: Optional[object],
+    ) -> None:
+        super().__init__()
+        self._chunks = resp.iter_bytes()
+        self._progress = progress
+        self._cancel_event = cancel_event
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        while not self._pending:
+            if self._cancel_event and self._cancel_event.is_set():
+                raise DownloadError("Download cancelled by user.")
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._progress.add(len(chunk))
+            self._pending = memoryview(chunk)
+        n = min(len(buf), len(self._pending))
+        buf[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def stream_download(
+    url: str,
+    consumer: Callable[[BinaryIO], _T],
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[object] = None,
+    on_retry: Optional[Callable[[], None]] = None,
+) -> _T:
+    """
+    Hand the body of *url* to *consumer* as a sequential file object.
+
+    Nothing is written to disk here: the consumer (e.g. a streaming archive
+    extractor) processes bytes as they arrive, so decoding overlaps the rest
+    of the transfer.  A half-consumed stream can't be resumed, so when the
+    connection drops the whole transfer starts over, up to MAX_RETRIES
+    attempts with the same backoff as download_file().  *on_retry* is called
+    before each new attempt so the consumer can discard its partial output;
+    without it the request is not retried.
+
+    Returns
+    -------
+    Whatever *consumer* returns.
+
+    Raises
+    ------
+    DownloadError
+        On HTTP errors, network failures or cancellation.  Exceptions raised
+        by *consumer* itself propagate unchanged.
+    """
+    last_error: Optional[Exception] = None
+    attempts = MAX_RETRIES if on_retry is not None else 1
+    for attempt in range(1, attempts + 1):
+        try:
+            return _attempt_stream(url, consumer, progress_callback, cancel_event)
+        except httpx.TransportError as exc:
+            # Connection-level failure: worth another try from the start.
+            last_error = exc
+        if attempt == attempts:
+            break
+        delay = RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
+        if cancel_event:
+            # Event.wait doubles as an interruptible sleep.
+            if cancel_event.wait(delay):
+                raise DownloadError("Download cancelled by user.")
+        else:
+            time.sleep(delay)
+        on_retry()
+
+    if attempts == 1:
+        raise DownloadError(f"Network error during download: {last_error}") from last_error
+    raise DownloadError(
+        f"Download failed after {attempts} attempts. Last error: {last_error}"
+    ) from last_error
+
+
+def _attempt_stream(
+    url: str,
+    consumer: Callable[[BinaryIO], _T],
+    progress_callback: Optional[ProgressCallback],
+    cancel_event: Optional[object],
+) -> _T:
+    """One stream_download() attempt; transport errors propagate unwrapped."""
+    try:
+        with _get_client().stream("GET", url) as resp:
+            try:
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                raise DownloadError(
+                    f"Server returned HTTP {exc.response.status_code} for URL: {url}"
+                ) from exc
+            progress = _SharedProgress(
+                int(resp.headers.get("content-length", -1)), progress_callback
+            )
+            reader = io.BufferedReader(
+                _ResponseReader(resp, progress, cancel_event), CHUNK_SIZE
+            )
+            result = consumer(reader)
+            progress.finish()
+            return result
+    except httpx.TransportError:
+        raise
+    except httpx.RequestError as exc:
+        raise DownloadError(f"Network error during download: {exc}") from exc
@@ -24,6 +24,15 @@ import httpx
 
 from services.exceptions import DownloadError
 from services.download_profiles import get_profile
+from services.download_service import (
+    CHUNK_SIZE,
+    CONNECT_TIMEOUT,
+    MAX_RETRIES,
+    PROGRESS_INTERVAL,
+    PROGRESS_MIN_BYTES,
+    _filename_from_headers,
+    _filename_from_url,
+)
 
 # Tipos
 ProgressCallback = Callable[[int, int, Dict[str, Any]], None]  # bytes, total, telemetria
@@ -46,31 +55,6 @@ class DownloadTelemetry:
         self.active_conns = 0
         self.mode = "single-stream"
 
-def _filename_from_headers(headers: httpx.Headers) -> Optional[str]:
-    cd = headers.get("content-disposition", "")
-    if not cd:
-        return None
-    for part in cd.split(";"):
-        part = part.strip()
-        if part.lower().startswith("filename="):
-            name = part[len("filename="):].strip().strip('"').strip("'")
-            return name or None
-    return None
-
-def _filename_from_url(url: str) -> str:
-    from urllib.parse import urlparse, unquote
-    parsed = urlparse(url)
-    name = unquote(parsed.path.split("/")[-1])
-    return name if name else "download.bin"
-
-async def _cleanup_partial_async(dest_dir: Path, filename: str) -> None:
-    partial = dest_dir / filename
-    try:
-        if partial.exists():
-            partial.unlink()
-    except OSError:
-        pass
-
 # --- Função principal (esqueleto inicial) ---
 
 
@@ -100,13 +84,13 @@ async def download_file_optimized(
         try:
             async with httpx.AsyncClient(http2=True, timeout=probe_timeout, follow_redirects=True, verify=verify_ssl) as client:
                 start = asyncio.get_event_loop().time()
-                resp = await client.get(murl, headers={"Range": f"bytes=0-{probe_size-1}"}, stream=True)
-                resp.raise_for_status()
-                n = 0
-                async for chunk in resp.aiter_bytes(1024 * 256):
-                    n += len(chunk)
-                    if n >= probe_size:
-                        break
+                async with client.stream("GET", murl, headers={"Range": f"bytes=0-{probe_size-1}"}) as resp:
+                    resp.raise_for_status()
+                    n = 0
+                    async for chunk in resp.aiter_bytes(1024 * 256):
+                        n += len(chunk)
+                        if n >= probe_size:
+                            break
                 elapsed = asyncio.get_event_loop().time() - start
                 speed = n / elapsed if elapsed > 0 else 0
                 return {"url": murl, "latency": elapsed, "speed": speed}
@@ -258,30 +242,32 @@ async def download_file_async(
 ) -> Path:
     dest_dir.mkdir(parents=True, exist_ok=True)
     last_error: Optional[Exception] = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            return await _attempt_download_async(
-                url, dest_dir, progress_callback, filename_override
-            )
-        except DownloadError as exc:
-            last_error = exc
-            if attempt < MAX_RETRIES:
-                await _cleanup_partial_async(dest_dir, filename_override or _filename_from_url(url))
-            continue
+    # One client for every attempt, so retries reuse the pooled connection.
+    # (An AsyncClient is tied to its event loop and can't be module-level.)
+    timeout = httpx.Timeout(connect=CONNECT_TIMEOUT, read=None, write=None, pool=None)
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                return await _attempt_download_async(
+                    client, url, dest_dir, progress_callback, filename_override
+                )
+            except DownloadError as exc:
+                # The failed attempt already removed whatever it wrote.
+                last_error = exc
+                continue
     raise DownloadError(
         f"Download failed after {MAX_RETRIES} attempts. Last error: {last_error}"
     ) from last_error
 
 async def _attempt_download_async(
+    client: httpx.AsyncClient,
     url: str,
     dest_dir: Path,
     progress_callback: Optional[ProgressCallback],
     filename_override: Optional[str],
 ) -> Path:
-    timeout = httpx.Timeout(connect=CONNECT_TIMEOUT, read=None, write=None, pool=None)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        try:
-            resp = await client.get(url, stream=True)
+    try:
+        async with client.stream("GET", url) as resp:
             resp.raise_for_status()
             filename = (
                 filename_override
@@ -293,41 +279,36 @@ async def _attempt_download_async(
             dest_path = dest_dir / filename
             total_bytes = int(resp.headers.get("content-length", -1))
             downloaded = 0
-            with open(dest_path, "wb") as fh:
-                async for chunk in resp.aiter_bytes(chunk_size=CHUNK_SIZE):
-                    if not chunk:
-                        continue
-                    fh.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        progress_callback(downloaded, total_bytes)
-        except httpx.RequestError as exc:
-            raise DownloadError(f"Network error during download: {exc}") from exc
-        except OSError as exc:
-            raise DownloadError(f"I/O error writing download to disk: {exc}") from exc
+            loop = asyncio.get_running_loop()
+            last_emit_time = loop.time()
+            last_emit_bytes = 0
+            # aiofiles runs the writes on a thread so a slow disk doesn't
+            # stall other downloads sharing the event loop.
+            try:
+                async with aiofiles.open(dest_path, "wb") as fh:
+                    async for chunk in resp.aiter_bytes(chunk_size=CHUNK_SIZE):
+                        if not chunk:
+                            continue
+                        await fh.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback:
+                            now = loop.time()
+                            if (
+                                now - last_emit_time >= PROGRESS_INTERVAL
+                                or downloaded - last_emit_bytes >= PROGRESS_MIN_BYTES
+                            ):
+                                progress_callback(downloaded, total_bytes)
+                                last_emit_time = now
+                                last_emit_bytes = downloaded
+            except BaseException:
+                # Remove the partial file under the name this attempt chose,
+                # which may come from Content-Disposition rather than the URL.
+                dest_path.unlink(missing_ok=True)
+                raise
+            if progress_callback and downloaded != last_emit_bytes:
+                progress_callback(downloaded, total_bytes)
+    except httpx.RequestError as exc:
+        raise DownloadError(f"Network error during download: {exc}") from exc
+    except OSError as exc:
+        raise DownloadError(f"I/O error writing download to disk: {exc}") from exc
     return dest_path
-
-def _filename_from_headers(headers: httpx.Headers) -> Optional[str]:
-    cd = headers.get("content-disposition", "")
-    if not cd:
-        return None
-    for part in cd.split(";"):
-        part = part.strip()
-        if part.lower().startswith("filename="):
-            name = part[len("filename="):].strip().strip('"').strip("'")
-            return name or None
-    return None
-
-def _filename_from_url(url: str) -> str:
-    from urllib.parse import urlparse, unquote
-    parsed = urlparse(url)
-    name = unquote(parsed.path.split("/")[-1])
-    return name if name else "download.bin"
-
-async def _cleanup_partial_async(dest_dir: Path, filename: str) -> None:
-    partial = dest_dir / filename
-    try:
-        if partial.exists():
-            partial.unlink()
-    except OSError:
-        pass
@@ -5,7 +5,8 @@ Security
 --------
 All extracted paths are validated against the destination directory before any
 file is written, preventing path-traversal attacks embedded in malicious
-archives (ZIP slip).
+archives (ZIP slip).  TAR archives use the stdlib "data" extraction filter
+where the interpreter provides it (3.12, and security backports of 3.8+).
 
 Supported formats
 -----------------
@@ -13,37 +14,109 @@ Supported formats
   .rar            – patool / unrar CLI (requires unrar on PATH or patool)
   .7z             – py7zr (pure Python) or patool / 7z CLI
   .tar .tar.gz etc– stdlib tarfile (bonus support)
+  .iso.gz/.bz2/.xz– stdlib gzip / bz2 / lzma (single compressed image)
 
 patool is used as a universal fallback when format-specific libraries are
 unavailable; it delegates to whatever extraction tools are installed on the
 system.
 """
 
+import bz2
+import gzip
+import lzma
 import os
 import shutil
 import tarfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, List, Optional
+from urllib.parse import unquote
 
 from services.exceptions import ExtractionError
 
 # Archive extensions we handle.
 ARCHIVE_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".001"}
+_ARCHIVE_SUFFIXES = tuple(ARCHIVE_EXTENSIONS)
+
+# A bare disc image compressed as a single stream (no archive container).
+_SINGLE_FILE_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+COMPRESSED_ISO_SUFFIXES = (".iso.gz", ".iso.bz2", ".iso.xz")
+_TAR_STREAM_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# Formats that can be extracted front-to-back from a non-seekable stream.
+# ZIP (central directory at the end), RAR and 7z all need random access.
+STREAMABLE_SUFFIXES = _TAR_STREAM_SUFFIXES + COMPRESSED_ISO_SUFFIXES
+
+# Copy buffer for single-stream decompression.
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Worker threads for multi-member ZIP extraction.  zlib releases the GIL
+# while inflating, so members decompress in parallel.
+ZIP_EXTRACT_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Extraction threads per performance profile (the "aggressive" / "safe"
+# choice the window offers); unknown profiles use ZIP_EXTRACT_WORKERS.
+PROFILE_EXTRACT_THREADS = {"aggressive": ZIP_EXTRACT_WORKERS, "safe": 2}
 
 
 def is_archive(path: Path) -> bool:
     """Return True when *path* has a recognised archive extension."""
-    suffix = path.suffix.lower()
-    # Handle multi-part archives like game.part1.rar → .rar
-    suffixes = [s.lower() for s in path.suffixes]
-    return any(s in ARCHIVE_EXTENSIONS for s in suffixes)
+    # Multi-part archives like game.part1.rar still end in .rar.
+    return path.name.lower().endswith(_ARCHIVE_SUFFIXES)
+
+
+def is_streamable(name: str) -> bool:
+    """Return True when *name* (a file name or URL) can be stream-extracted."""
+    return _stream_filename(name).lower().endswith(STREAMABLE_SUFFIXES)
+
+
+def extract_stream(fileobj: BinaryIO, dest_dir: Path, name: str) -> Path:
+    """
+    Extract an archive read sequentially from *fileobj*.
+
+    Used to unpack a download while it is still arriving, without writing the
+    archive itself to disk.  *name* is the archive's file name or URL and
+    selects the format; it must satisfy is_streamable().
+
+    Raises
+    ------
+    ExtractionError
+        On a corrupt archive, a security violation or a write failure.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    filename = _stream_filename(name)
+    if filename.lower().endswith(COMPRESSED_ISO_SUFFIXES):
+        _decompress_single(fileobj, dest_dir, filename)
+        return dest_dir
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|*") as tf:
+            _extract_tar_members(tf, dest_dir)
+    except _TAR_FILTER_ERRORS as exc:
+        raise ExtractionError(f"Unsafe TAR member rejected: {exc}") from exc
+    except tarfile.TarError as exc:
+        raise ExtractionError(f"Corrupt or invalid TAR archive: {exc}") from exc
+    except OSError as exc:
+        raise ExtractionError(f"I/O error during extraction: {exc}") from exc
+    return dest_dir
 
 
-def extract(archive_path: Path, dest_dir: Path) -> Path:
+def extract(
+    archive_path: Path,
+    dest_dir: Path,
+    threads: Optional[int] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Path:
     """
     Extract *archive_path* into *dest_dir*.
 
+    *threads* caps the decompression threads for formats extracted in
+    parallel (currently ZIP), never beyond ZIP_EXTRACT_WORKERS; None means
+    ZIP_EXTRACT_WORKERS.  RAR goes through unrar, which already decodes on
+    all cores.  Setting *cancel_event* stops a ZIP extraction before its
+    next member.
+
     Returns
     -------
     Path
@@ -64,8 +137,16 @@ def extract(archive_path: Path, dest_dir: Path) -> Path:
     suffixes = [s.lower() for s in archive_path.suffixes]
 
     try:
-        if suffix == ".zip":
-            _extract_zip(archive_path, dest_dir)
+        if archive_path.name.lower().endswith(COMPRESSED_ISO_SUFFIXES):
+            with open(archive_path, "rb") as fh:
+                _decompress_single(fh, dest_dir, archive_path.name)
+        elif suffix == ".zip":
+            _extract_zip(
+                archive_path,
+                dest_dir,
+                min(threads or ZIP_EXTRACT_WORKERS, ZIP_EXTRACT_WORKERS),
+                cancel_event,
+            )
         elif suffix == ".rar" or ".rar" in suffixes:
             _extract_rar(archive_path, dest_dir)
         elif suffix == ".7z" or ".7z" in suffixes:
@@ -88,37 +169,147 @@ def extract(archive_path: Path, dest_dir: Path) -> Path:
 # ── Format-specific extractors ────────────────────────────────────────────────
 
 
-def _extract_zip(archive: Path, dest: Path) -> None:
+def _extract_zip(
+    archive: Path,
+    dest: Path,
+    threads: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> None:
     """Extract ZIP archive with path-traversal protection."""
     try:
+        checker = _make_checker(dest)
+        files = []
         with zipfile.ZipFile(archive, "r") as zf:
             for member in zf.infolist():
                 # Sanitise member path.
-                member_path = _safe_member_path(dest, member.filename)
+                member_path = checker(member.filename)
                 if member_path is None:
                     raise ExtractionError(
                         f"Path traversal detected in ZIP member: {member.filename}"
                     )
-                zf.extract(member, dest)
+                if member.is_dir():
+                    zf.extract(member, dest)
+                else:
+                    # Create parents up front so workers never race on them.
+                    member_path.parent.mkdir(parents=True, exist_ok=True)
+                    files.append(member)
+
+            if len(files) < 2 or threads < 2:
+                for member in files:
+                    _check_cancelled(cancel_event)
+                    zf.extract(member, dest)
+                return
+
+        _extract_zip_parallel(archive, dest, files, threads, cancel_event)
     except zipfile.BadZipFile as exc:
         raise ExtractionError(f"Corrupt or invalid ZIP archive: {exc}") from exc
 
 
+def _extract_zip_parallel(
+    archive: Path,
+    dest: Path,
+    members: List[zipfile.ZipInfo],
+    threads: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> None:
+    """
+    Extract already-validated *members* on a thread pool.
+
+    ZipFile is not safe for concurrent reads, so each worker thread opens
+    its own handle on first use.
+    """
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+
+    def extract_one(member: zipfile.ZipInfo) -> None:
+        _check_cancelled(cancel_event)
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(archive, "r")
+            with handles_lock:
+                handles.append(zf)
+        zf.extract(member, dest)
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(threads, len(members)), thread_name_prefix="unzip"
+    )
+    try:
+        # list() re-raises the first worker exception.
+        list(pool.map(extract_one, members))
+    finally:
+        # After a failure or a cancel, drop the members not yet started.
+        pool.shutdown(cancel_futures=True)
+        for zf in handles:
+            zf.close()
+
+
+def _check_cancelled(cancel_event: Optional[threading.Event]) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise ExtractionError("Extraction cancelled by user.")
+
+
 def _extract_tar(archive: Path, dest: Path) -> None:
     """Extract TAR-family archives with path-traversal protection."""
     try:
         with tarfile.open(archive, "r:*") as tf:
-            for member in tf.getmembers():
-                member_path = _safe_member_path(dest, member.name)
-                if member_path is None:
-                    raise ExtractionError(
-                        f"Path traversal detected in TAR member: {member.name}"
-                    )
-            tf.extractall(dest)
+            _extract_tar_members(tf, dest)
+    except _TAR_FILTER_ERRORS as exc:
+        raise ExtractionError(f"Unsafe TAR member rejected: {exc}") from exc
     except tarfile.TarError as exc:
         raise ExtractionError(f"Corrupt or invalid TAR archive: {exc}") from exc
 
 
+# tarfile's extraction filters reject absolute paths, traversal, links that
+# escape the destination and device files without a Python-side pre-pass.
+_HAS_TAR_FILTERS = hasattr(tarfile, "data_filter")
+_TAR_FILTER_ERRORS = (tarfile.FilterError,) if _HAS_TAR_FILTERS else ()
+
+
+def _extract_tar_members(tf: tarfile.TarFile, dest: Path) -> None:
+    if _HAS_TAR_FILTERS:
+        tf.extractall(dest, filter="data")
+    else:
+        tf.extractall(dest, members=_checked_tar_members(tf, dest))
+
+
+def _checked_tar_members(tf: tarfile.TarFile, dest: Path):
+    """
+    Yield members as extractall() consumes them, validating each one.
+
+    Only used on interpreters without tarfile extraction filters.
+    """
+    # Links extracted earlier in the stream can redirect later members.
+    checker = _make_checker(dest, resolve_links=True)
+    for member in tf:
+        if checker(member.name) is None:
+            raise ExtractionError(
+                f"Path traversal detected in TAR member: {member.name}"
+            )
+        yield member
+
+
+def _decompress_single(fileobj: BinaryIO, dest: Path, filename: str) -> None:
+    """Decompress a single-stream image (game.iso.xz → game.iso) into *dest*."""
+    stem, ext = os.path.splitext(Path(filename).name)
+    try:
+        with _SINGLE_FILE_OPENERS[ext.lower()](fileobj) as src, open(
+            dest / stem, "wb"
+        ) as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+    except (EOFError, lzma.LZMAError) as exc:
+        raise ExtractionError(f"Corrupt or truncated {ext} stream: {exc}") from exc
+    except OSError as exc:
+        # gzip/bz2 report bad data as OSError too.
+        raise ExtractionError(f"Failed to decompress '{filename}': {exc}") from exc
+
+
+def _stream_filename(name: str) -> str:
+    """Last path component of a file name or URL, without query/fragment."""
+    path = name.split("?", 1)[0].split("#", 1)[0]
+    return unquote(path.replace("\\", "/").rsplit("/", 1)[-1])
+
+
 def _extract_rar(archive: Path, dest: Path) -> None:
     """Extract RAR using py7zr (supports RAR5) or fallback to patool."""
     # Try rarfile first
@@ -126,10 +317,10 @@ def _extract_rar(archive: Path, dest: Path) -> None:
         import rarfile  # type: ignore
 
         rarfile.UNRAR_TOOL = shutil.which("unrar") or "unrar"
+        checker = _make_checker(dest)
         with rarfile.RarFile(str(archive)) as rf:
             for member in rf.infolist():
-                member_path = _safe_member_path(dest, member.filename)
-                if member_path is None:
+                if checker(member.filename) is None:
                     raise ExtractionError(
                         f"Path traversal detected in RAR member: {member.filename}"
                     )
@@ -149,10 +340,11 @@ def _extract_7z(archive: Path, dest: Path) -> None:
     try:
         import py7zr  # type: ignore
 
+        checker = _make_checker(dest)
         with py7zr.SevenZipFile(str(archive), mode="r") as sz:
             all_names = sz.getnames()
             for name in all_names:
-                if _safe_member_path(dest, name) is None:
+                if checker(name) is None:
                     raise ExtractionError(
                         f"Path traversal detected in 7z member: {name}"
                     )
@@ -184,20 +376,45 @@ def _extract_patool(archive: Path, dest: Path) -> None:
 # ── Security helper ───────────────────────────────────────────────────────────
 
 
-def _safe_member_path(dest: Path, member_name: str) -> Optional[Path]:
+def _make_checker(
+    dest: Path, resolve_links: bool = False
+) -> Callable[[str], Optional[Path]]:
     """
-    Resolve *member_name* relative to *dest* and confirm it stays inside.
+    Build a member-path validator bound to *dest*.
+
+    The destination is resolved once; the returned callable checks that
+    *member_name* stays inside it, returning the target path on success and
+    None on a path-traversal attempt.
 
-    Returns the resolved path on success, None on path-traversal attempt.
+    With *resolve_links* the target is also resolved through symlinks that
+    already exist on disk.  That only matters when members are validated
+    while extraction is running, so earlier members (links) can affect later
+    ones; up-front validation of a fresh directory uses pure string checks.
     """
-    # Normalise separators and strip leading / or ..
-    clean = os.path.normpath(member_name.replace("\\", "/"))
-    # Reject absolute paths and any remaining upward traversal
-    if os.path.isabs(clean) or clean.startswith(".."):
-        return None
-    resolved = (dest / clean).resolve()
-    try:
-        resolved.relative_to(dest.resolve())
-    except ValueError:
-        return None
-    return resolved
+    root = os.path.realpath(dest)
+
+    def check(member_name: str) -> Optional[Path]:
+        clean = member_name.replace("\\", "/")
+        # Reject absolute, UNC and drive-qualified paths.
+        if clean.startswith("/") or clean[1:2] == ":":
+            return None
+        if not resolve_links and ".." not in clean.split("/"):
+            # Plain relative name: it cannot climb out of root.
+            return Path(root, clean)
+
+        # Normalise and reject any remaining upward traversal
+        clean = os.path.normpath(clean)
+        if os.path.isabs(clean) or clean.split(os.sep, 1)[0] == "..":
+            return None
+        target = os.path.join(root, clean)
+        if resolve_links:
+            target = os.path.realpath(target)
+        try:
+            if os.path.commonpath((root, target)) != root:
+                return None
+        except ValueError:
+            # Different drives on Windows.
+            return None
+        return Path(target)
+
+    return check
@@ -1,6 +1,8 @@
 
 import re
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
 
 import httpx
 from bs4 import BeautifulSoup, Tag
@@ -32,6 +34,55 @@ LINK_PATTERN: re.Pattern = re.compile(r"/(xbox|games?)/", re.IGNORECASE)
 # HTTP timeout (seconds)
 HTTP_TIMEOUT: float = 30.0
 
+# BeautifulSoup tree builder: libxml2 via lxml when installed, otherwise the
+# pure-Python stdlib parser.
+try:
+    from lxml import etree as _etree
+
+    HTML_PARSER: str = "lxml"
+except ImportError:
+    _etree = None
+    HTML_PARSER = "html.parser"
+
+# Mirror-link heuristics used by _is_download_link().
+_DOWNLOAD_EXTENSIONS = (".iso", ".zip", ".rar", ".7z", ".part1.rar", ".001")
+# "link" and "get" are whole words only, so labels like "widget" don't match.
+_DOWNLOAD_KEYWORD_RE = re.compile(
+    r"mirror|download|direct|\blink\b|\bget\b", re.IGNORECASE
+)
+
+# Parsed mirror lists by detail URL, so reopening a game doesn't refetch its
+# page.  Least recently used entries are dropped beyond MIRROR_CACHE_SIZE.
+MIRROR_CACHE_SIZE: int = 64
+_mirror_cache: "OrderedDict[str, List[MirrorLink]]" = OrderedDict()  # noqa: F821
+_mirror_cache_lock = threading.Lock()
+
+# ── Shared client ────────────────────────────────────────────────────────────
+
+# The catalogue and every detail page live on the same host, so one pooled
+# client lets consecutive page loads reuse the open TCP/TLS connection.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the process-wide page client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(timeout=HTTP_TIMEOUT, follow_redirects=True)
+        return _client
+
+
+def close_client() -> None:
+    """Close the shared client and its pooled connections (call on shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
 # ── Public API ───────────────────────────────────────────────────────────────
 
 
@@ -50,8 +101,16 @@ def fetch_catalogue() -> List[GameEntry]:
         On any network or parse failure.
     """
     try:
-        response = httpx.get(CATALOGUE_URL, timeout=HTTP_TIMEOUT, follow_redirects=True)
-        response.raise_for_status()
+        with _get_client().stream("GET", CATALOGUE_URL) as response:
+            response.raise_for_status()
+            base_url = str(response.url)
+            if _can_stream_parse():
+                entries = _stream_parse_catalogue(
+                    response.iter_bytes(), base_url, response.encoding
+                )
+            else:
+                response.read()
+                entries = _parse_catalogue(response.text, base_url)
     except httpx.HTTPStatusError as exc:
         raise SearchError(
             f"Catalogue server returned HTTP {exc.response.status_code}."
@@ -59,9 +118,6 @@ def fetch_catalogue() -> List[GameEntry]:
     except httpx.RequestError as exc:
         raise SearchError(f"Network error while fetching catalogue: {exc}") from exc
 
-    html = response.text
-    entries = _parse_catalogue(html, base_url=str(response.url))
-
     if not entries:
         raise SearchError(
             "Catalogue page was retrieved but no game entries could be parsed. "
@@ -88,7 +144,7 @@ def search(entries: List[GameEntry], query: str) -> List[GameEntry]:
     q = query.strip().lower()
     if not q:
         return entries
-    return [e for e in entries if q in e.title.lower()]
+    return [e for e in entries if q in e.title_lower]
 
 
 def fetch_mirrors(game: GameEntry) -> List["MirrorLink"]:  # noqa: F821
@@ -105,12 +161,14 @@ def fetch_mirrors(game: GameEntry) -> List["MirrorLink"]:  # noqa: F821
     SearchError
         On network failure or when no mirrors are found.
     """
-    from models.game_entry import MirrorLink  # local import to avoid circular
+    with _mirror_cache_lock:
+        cached = _mirror_cache.get(game.detail_url)
+        if cached is not None:
+            _mirror_cache.move_to_end(game.detail_url)
+            return list(cached)
 
     try:
-        response = httpx.get(
-            game.detail_url, timeout=HTTP_TIMEOUT, follow_redirects=True
-        )
+        response = _get_client().get(game.detail_url)
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise SearchError(
@@ -119,7 +177,25 @@ def fetch_mirrors(game: GameEntry) -> List["MirrorLink"]:  # noqa: F821
     except httpx.RequestError as exc:
         raise SearchError(f"Network error fetching mirror list: {exc}") from exc
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    mirrors = _parse_mirrors(game, response.text, str(response.url))
+    with _mirror_cache_lock:
+        _mirror_cache[game.detail_url] = mirrors
+        _mirror_cache.move_to_end(game.detail_url)
+        while len(_mirror_cache) > MIRROR_CACHE_SIZE:
+            _mirror_cache.popitem(last=False)
+    return list(mirrors)
+
+
+# ── Private helpers ───────────────────────────────────────────────────────────
+
+
+def _parse_mirrors(
+    game: GameEntry, html: str, base_url: str
+) -> List["MirrorLink"]:  # noqa: F821
+    """Extract de-duplicated mirror links from a game's detail page."""
+    from models.game_entry import MirrorLink  # local import to avoid circular
+
+    soup = BeautifulSoup(html, HTML_PARSER)
     mirrors: List[MirrorLink] = []
 
     # Strategy 1 – links explicitly labelled as mirrors / downloads.
@@ -129,7 +205,7 @@ def fetch_mirrors(game: GameEntry) -> List["MirrorLink"]:  # noqa: F821
 
         # Accept direct archive / ISO links and anything with "mirror" / "download"
         if _is_download_link(href, text):
-            absolute = _make_absolute(href, str(response.url))
+            absolute = _make_absolute(href, base_url)
             mirrors.append(MirrorLink(label=text, url=absolute))
 
     if not mirrors:
@@ -149,18 +225,108 @@ def fetch_mirrors(game: GameEntry) -> List["MirrorLink"]:  # noqa: F821
     return unique
 
 
-# ── Private helpers ───────────────────────────────────────────────────────────
-
-
 def _parse_catalogue(html: str, base_url: str) -> List[GameEntry]:
     """Try structured parse first; fall back to plain link harvesting."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     entries = _structured_parse(soup, base_url)
     if not entries:
         entries = _fallback_parse(soup, base_url)
     return entries
 
 
+def _can_stream_parse() -> bool:
+    """Streaming needs lxml and plain tag names for the row/anchor selectors."""
+    return (
+        _etree is not None
+        and ROW_SELECTOR.isidentifier()
+        and TITLE_ANCHOR_SELECTOR.isidentifier()
+    )
+
+
+def _stream_parse_catalogue(
+    chunks: Iterable[bytes], base_url: str, encoding: Optional[str] = None
+) -> List[GameEntry]:
+    """
+    Incrementally parse the catalogue as the body arrives.
+
+    Equivalent to _parse_catalogue() for tag-name selectors, but each row is
+    turned into a GameEntry on its closing tag and then dropped from the
+    tree, so neither the decoded page nor a full DOM is ever held in memory.
+    Fallback candidates are collected in the same pass as (title, href)
+    pairs and only used if no structured row matched.
+    """
+    parser = _etree.HTMLPullParser(
+        events=("end",), tag=(ROW_SELECTOR, "a"), encoding=encoding
+    )
+    entries: List[GameEntry] = []
+    fallback: List[tuple] = []
+
+    def drain() -> None:
+        for _event, elem in parser.read_events():
+            if elem.tag == "a":
+                href = (elem.get("href") or "").strip()
+                if href and LINK_PATTERN.search(href):
+                    title = _element_text(elem)
+                    if title:
+                        fallback.append((title, href))
+            if elem.tag == ROW_SELECTOR:
+                entry = _row_entry(elem, base_url)
+                if entry is not None:
+                    entries.append(entry)
+                # Free the finished row and everything before it.
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        drain()
+    parser.close()
+    drain()
+
+    if entries:
+        return entries
+    return [
+        GameEntry(title=title, detail_url=_make_absolute(href, base_url))
+        for title, href in fallback
+    ]
+
+
+def _row_entry(row, base_url: str) -> Optional[GameEntry]:
+    """Build a GameEntry from an lxml row element, as _structured_parse does."""
+    anchor = next(row.iter(TITLE_ANCHOR_SELECTOR), None)
+    if anchor is None or not anchor.get("href"):
+        return None
+    title = _element_text(anchor)
+    href = anchor.get("href").strip()
+    if not title or not href:
+        return None
+
+    cells = list(row.iter("td"))
+    region = _element_cell_text(cells, REGION_TD_INDEX)
+    size = _element_cell_text(cells, SIZE_TD_INDEX)
+
+    return GameEntry(
+        title=title,
+        detail_url=_make_absolute(href, base_url),
+        region=region,
+        size_hint=size,
+    )
+
+
+def _element_text(elem) -> str:
+    """lxml counterpart of BeautifulSoup's get_text(strip=True)."""
+    return "".join(s.strip() for s in elem.itertext())
+
+
+def _element_cell_text(cells: list, index: Optional[int]) -> str:
+    if index is None or index >= len(cells):
+        return ""
+    return _element_text(cells[index])
+
+
 def _structured_parse(soup: BeautifulSoup, base_url: str) -> List[GameEntry]:
     entries: List[GameEntry] = []
     for row in soup.select(ROW_SELECTOR):
@@ -219,14 +385,6 @@ def _make_absolute(href: str, base_url: str) -> str:
 
 def _is_download_link(href: str, text: str) -> bool:
     """Heuristic: is this anchor pointing to a downloadable file?"""
-    download_extensions = (
-        ".iso", ".zip", ".rar", ".7z", ".part1.rar", ".001"
-    )
-    download_keywords = ("mirror", "download", "direct", "link", "get")
-
-    href_lower = href.lower()
-    text_lower = text.lower()
-
-    return any(href_lower.endswith(ext) for ext in download_extensions) or any(
-        kw in text_lower for kw in download_keywords
+    return href.lower().endswith(_DOWNLOAD_EXTENSIONS) or bool(
+        _DOWNLOAD_KEYWORD_RE.search(text)
     )
@@ -6,12 +6,21 @@ Responsibilities
 1. Check that the destination drive has enough free space.
 2. Move the converted output from the temp working directory to the user-chosen
    install directory.
-3. Clean up the temporary working directory on success (or leave it on failure
-   so the user can recover data).
+3. Clean up the temporary working directory once an install job ends, whatever
+   its outcome.
 """
 
+import atexit
+import errno
+import functools
+import logging
+import os
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from services.exceptions import InsufficientDiskSpaceError, StorageError
 
@@ -19,6 +28,15 @@ from services.exceptions import InsufficientDiskSpaceError, StorageError
 # file size to account for filesystem overhead, GOD container overhead, etc.
 DISK_SAFETY_BUFFER_BYTES: int = 512 * 1024 * 1024  # 512 MiB
 
+# Temp-dir removal runs on a single background thread so back-to-back
+# installs queue their cleanups instead of spawning a thread each.
+_cleanup_executor: Optional[ThreadPoolExecutor] = None
+_cleanup_lock = threading.Lock()
+
+# Free-space readings are reused within this window (seconds) so repeated
+# checks during a UI refresh burst share one statvfs/GetDiskFreeSpaceExW.
+DISK_USAGE_TTL: float = 0.5
+
 
 def check_disk_space(path: Path, required_bytes: int) -> None:
     """
@@ -35,12 +53,15 @@ def check_disk_space(path: Path, required_bytes: int) -> None:
     StorageError on any filesystem error.
     """
     # Walk up until we find an existing directory to stat.
-    probe = path
-    while not probe.exists() and probe != probe.parent:
-        probe = probe.parent
+    probe = os.path.abspath(path)
+    while not os.path.exists(probe):
+        parent = os.path.dirname(probe)
+        if parent == probe:
+            break
+        probe = parent
 
     try:
-        usage = shutil.disk_usage(probe)
+        usage = _disk_usage_cached(probe, int(time.monotonic() / DISK_USAGE_TTL))
     except OSError as exc:
         raise StorageError(f"Cannot check disk space on '{probe}': {exc}") from exc
 
@@ -51,6 +72,12 @@ def check_disk_space(path: Path, required_bytes: int) -> None:
         )
 
 
+@functools.lru_cache(maxsize=8)
+def _disk_usage_cached(probe: str, tick: int) -> "shutil._ntuple_diskusage":
+    """shutil.disk_usage() memoised per *probe* for one TTL bucket (*tick*)."""
+    return shutil.disk_usage(probe)
+
+
 def install(source_dir: Path, dest_dir: Path) -> Path:
     """
     Move the contents of *source_dir* into *dest_dir*.
@@ -86,9 +113,7 @@ def install(source_dir: Path, dest_dir: Path) -> Path:
             # Move the single sub-directory directly.
             game_folder = children[0]
             target = dest_dir / game_folder.name
-            if target.exists():
-                shutil.rmtree(target)
-            shutil.move(str(game_folder), str(target))
+            _move(game_folder, target)
             return target
         else:
             # Multiple items – move all into a new named folder.
@@ -96,13 +121,7 @@ def install(source_dir: Path, dest_dir: Path) -> Path:
             target = dest_dir / source_dir.name
             target.mkdir(exist_ok=True)
             for item in children:
-                dst = target / item.name
-                if dst.exists():
-                    if dst.is_dir():
-                        shutil.rmtree(dst)
-                    else:
-                        dst.unlink()
-                shutil.move(str(item), str(dst))
+                _move(item, target / item.name)
             return target
     except OSError as exc:
         raise StorageError(
@@ -110,20 +129,102 @@ def install(source_dir: Path, dest_dir: Path) -> Path:
         ) from exc
 
 
+def _move(src: Path, dst: Path) -> None:
+    """
+    Move *src* to *dst*, replacing whatever is already there.
+
+    Same-volume moves are a single metadata-only rename; shutil.move's
+    copy-and-delete is only used when the temp and install directories are
+    on different devices.
+    """
+    if dst.is_dir() and not dst.is_symlink():
+        # Directories can't be renamed over a non-empty target.
+        shutil.rmtree(dst)
+    elif src.is_dir() and (dst.exists() or dst.is_symlink()):
+        dst.unlink()
+    try:
+        # Files are overwritten atomically.
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        if dst.exists() or dst.is_symlink():
+            dst.unlink()
+        shutil.move(str(src), str(dst))
+
+
 def cleanup_temp(temp_dir: Path) -> None:
     """
-    Remove the temporary working directory and all its contents.
+    Schedule removal of the temporary working directory and all its contents.
+
+    Also accepts a single file or a sub-directory of it, so intermediates can
+    be released as soon as a later stage no longer needs them.
+
+    Returns immediately; the delete runs on a background thread so the
+    install is reported done without waiting on it.  Pending cleanups are
+    finished before the interpreter exits.  Failures are logged, not raised,
+    since cleanup failure should not mask a successful install.
+    """
+    _get_cleanup_executor().submit(_remove_temp, temp_dir)
+
 
-    Silently logs (but does not raise) if removal fails, since cleanup
-    failure should not mask a successful install.
+def release_page_cache(path: Path) -> None:
     """
+    Ask the OS to drop cached pages of the freshly installed files.
+
+    The converted game is written once and not read back by ROMTool, so its
+    multi-GiB page-cache footprint only evicts more useful data.  Each file
+    is flushed to disk first, since only clean pages can be dropped.  Runs on
+    the cleanup thread; a no-op where posix_fadvise is unavailable (Windows).
+    """
+    if hasattr(os, "posix_fadvise"):
+        _get_cleanup_executor().submit(_fadvise_dontneed, path)
+
+
+def _get_cleanup_executor() -> ThreadPoolExecutor:
+    global _cleanup_executor
+    with _cleanup_lock:
+        if _cleanup_executor is None:
+            _cleanup_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="temp-cleanup"
+            )
+            atexit.register(_cleanup_executor.shutdown, wait=True)
+        return _cleanup_executor
+
+
+def _fadvise_dontneed(path: Path) -> None:
+    if path.is_dir():
+        files = (
+            os.path.join(root, name)
+            for root, _dirs, names in os.walk(path)
+            for name in names
+        )
+    else:
+        files = (str(path),)
+    for name in files:
+        try:
+            fd = os.open(name, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            # DONTNEED only drops pages that are already clean; dirty ones
+            # stay cached.  Flush them first so the whole file is released.
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _remove_temp(temp_dir: Path) -> None:
     try:
-        if temp_dir.exists():
+        if temp_dir.is_dir():
             shutil.rmtree(temp_dir)
+        elif temp_dir.exists():
+            temp_dir.unlink()
     except OSError as exc:
         # Non-fatal – leave a warning in the log but don't raise.
-        import logging
-
         logging.getLogger(__name__).warning(
             "Could not remove temp directory '%s': %s", temp_dir, exc
         )
@@ -0,0 +1,99 @@
+"""
+Shared fixtures: a local HTTP file server, so download tests run offline.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from services import download_service
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Serves ``server.data`` for every path, honouring the server's settings."""
+
+    def log_message(self, format, *args) -> None:  # keep test output quiet
+        pass
+
+    def do_GET(self) -> None:
+        srv = self.server
+        srv.requests.append(dict(self.headers.items()))
+        data = srv.data
+        start, end, status = 0, len(data) - 1, 200
+
+        rng = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if srv.ranges and rng and (if_range is None or if_range == srv.etag):
+            lo, _, hi = rng.split("=", 1)[1].partition("-")
+            start = int(lo)
+            end = min(int(hi), len(data) - 1) if hi else len(data) - 1
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+            start += srv.range_shift
+
+        body = data[start:end + 1]
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if srv.etag:
+            self.send_header("ETag", srv.etag)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.end_headers()
+
+        if isinstance(srv.drop_after, list):
+            drop_after = srv.drop_after.pop(0) if srv.drop_after else None
+        else:
+            drop_after, srv.drop_after = srv.drop_after, None
+        if drop_after is not None:
+            # Cut the connection mid-body, then optionally "update" the file.
+            body = body[:drop_after]
+            if srv.replacement is not None:
+                srv.data, srv.etag = srv.replacement
+                srv.replacement = None
+        try:
+            for i in range(0, len(body), 64 * 1024):
+                self.wfile.write(body[i:i + 64 * 1024])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client hung up, e.g. a headers-only probe
+        if drop_after is not None:
+            self.close_connection = True
+
+
+class FileServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FileHandler)
+        self.data = b""
+        self.ranges = True
+        self.etag: Optional[str] = '"v1"'
+        # One-shot: send only this many body bytes of the next response; a
+        # list cuts that many successive responses.
+        self.drop_after: Union[int, List[int], None] = None
+        # Added to the start byte reported for a range (a misbehaving server).
+        self.range_shift = 0
+        # (data, etag) the file changes to once that response was cut.
+        self.replacement: Optional[Tuple[bytes, str]] = None
+        self.requests: List[Dict[str, str]] = []
+
+    def url(self, name: str = "game.iso") -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/{name}"
+
+
+@pytest.fixture
+def file_server(monkeypatch):
+    monkeypatch.setattr(download_service, "RETRY_BACKOFF_BASE", 0)
+    server = FileServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    download_service.close_client()
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,114 @@
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+from services import conversion_service
+from services.exceptions import ConversionError
+
+
+def _tool(tmp_path, body: str, name: str = "tool.py"):
+    """Write a stand-in for exiso / iso2god as a Python script."""
+    script = tmp_path / name
+    script.write_text("import sys, time\n" + textwrap.dedent(body))
+    return script
+
+
+def _run(script, *args, cb=None):
+    conversion_service._run_subprocess(
+        [sys.executable, str(script), *args], label="tool", cb=cb
+    )
+
+
+def test_carriage_return_progress_is_forwarded(tmp_path):
+    # Console tools redraw one line: "  5%\r 10%\r ..." with no newlines.
+    script = _tool(tmp_path, """
+        out = sys.stdout
+        for pct in (0, 5, 5, 10, 55, 100):
+            out.write(f"\\rExtracting... {pct:3d}%")
+            out.flush()
+        out.write("\\nDone\\n")
+    """)
+    calls = []
+
+    _run(script, cb=lambda current, total: calls.append((current, total)))
+
+    # Repeated percentages are reported once.
+    assert calls == [(0, 100), (5, 100), (10, 100), (55, 100), (100, 100)]
+
+
+def test_undecodable_output_does_not_abort(tmp_path):
+    script = _tool(tmp_path, """
+        sys.stdout.buffer.write(b"Title: Pok\\xe9mon \\xff\\xfe\\r 50%\\r\\n")
+        sys.stdout.flush()
+    """)
+    calls = []
+
+    _run(script, cb=lambda current, total: calls.append(current))
+
+    assert calls == [50]
+
+
+def test_failure_reports_output_tail(tmp_path):
+    script = _tool(tmp_path, """
+        for i in range(500):
+            print(f"line {i}")
+        print("ERROR: bad ISO header")
+        sys.exit(3)
+    """)
+
+    with pytest.raises(ConversionError) as info:
+        _run(script)
+
+    message = str(info.value)
+    assert "exited with code 3" in message
+    assert "ERROR: bad ISO header" in message
+    assert "line 0\n" not in message
+
+
+def test_watchdog_kills_hung_tool(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversion_service, "SUBPROCESS_TIMEOUT", 0.5)
+    script = _tool(tmp_path, """
+        print(" 10%", flush=True)
+        time.sleep(60)
+    """)
+    calls = []
+
+    start = time.monotonic()
+    with pytest.raises(ConversionError, match="time limit"):
+        _run(script, cb=lambda current, total: calls.append(current))
+
+    assert time.monotonic() - start < 30
+    assert calls == [10]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="needs an executable script")
+def test_convert_iso_runs_bundled_tool(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "argv.txt"
+    exiso = _tool(bin_dir, f"""
+        open({str(log)!r}, "w").write("\\n".join(sys.argv[1:]))
+        for pct in (25, 50, 75):
+            sys.stdout.write(f"\\r{{pct}}%")
+        sys.stdout.flush()
+    """, name="exiso.exe")
+    exiso.write_text(f"#!{sys.executable}\n" + exiso.read_text())
+    exiso.chmod(0o755)
+    monkeypatch.setenv("ROMTOOL_BASE", str(tmp_path))
+    conversion_service._bin_path.cache_clear()
+    iso, out = tmp_path / "game.iso", tmp_path / "out"
+    calls = []
+
+    try:
+        result = conversion_service.convert_iso(
+            iso, out, "XEX", progress_callback=lambda c, t: calls.append(c)
+        )
+    finally:
+        conversion_service._bin_path.cache_clear()
+
+    assert result == out and out.is_dir()
+    assert log.read_text().splitlines() == ["-d", str(out), str(iso)]
+    assert calls == [0, 25, 50, 75, 100]
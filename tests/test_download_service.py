@@ -0,0 +1,206 @@
+import io
+import lzma
+import os
+import shutil
+import tarfile
+import tracemalloc
+
+import pytest
+
+from services import download_service, extraction_service
+from services.exceptions import DownloadError
+
+
+def _payload(size: int) -> bytes:
+    return os.urandom(256) * (size // 256)
+
+
+def test_segmented_probe_does_not_buffer_body_without_range_support(file_server, tmp_path):
+    file_server.data = _payload(32 * 1024 * 1024)
+    file_server.ranges = False
+
+    tracemalloc.start()
+    try:
+        path = download_service.download_file_segmented(file_server.url(), tmp_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert path.read_bytes() == file_server.data
+    # Buffering the probe response would hold the full 32 MiB in memory.
+    assert peak < 8 * 1024 * 1024
+    assert len(file_server.requests) == 2  # the probe, then one plain download
+
+
+def test_segmented_download_uses_ranges(file_server, tmp_path):
+    file_server.data = _payload(4 * download_service.MIN_SEGMENT_SIZE)
+
+    path = download_service.download_file_segmented(file_server.url(), tmp_path, segments=4)
+
+    assert path.read_bytes() == file_server.data
+    seg = download_service.MIN_SEGMENT_SIZE
+    assert sorted(r["Range"] for r in file_server.requests[1:]) == sorted(
+        f"bytes={i * seg}-{(i + 1) * seg - 1}" for i in range(4)
+    )
+    assert all(r.get("If-Range") == '"v1"' for r in file_server.requests[1:])
+
+
+def test_resume_after_dropped_connection(file_server, tmp_path):
+    file_server.data = _payload(1024 * 1024)
+    file_server.drop_after = 300_000
+
+    path = download_service.download_file(file_server.url(), tmp_path)
+
+    assert path.read_bytes() == file_server.data
+    first, retry = file_server.requests
+    assert "Range" not in first
+    assert retry["Range"] == "bytes=300000-"
+    assert retry["If-Range"] == '"v1"'
+
+
+def test_resume_restarts_when_server_ignores_range(file_server, tmp_path):
+    file_server.data = _payload(1024 * 1024)
+    file_server.ranges = False
+    file_server.drop_after = 300_000
+
+    path = download_service.download_file(file_server.url(), tmp_path)
+
+    assert path.read_bytes() == file_server.data
+    assert file_server.requests[1]["Range"] == "bytes=300000-"
+
+
+def test_resume_restarts_when_etag_changed(file_server, tmp_path):
+    old = _payload(1024 * 1024)
+    new = _payload(1024 * 1024 + 512)
+    file_server.data = old
+    file_server.drop_after = 300_000
+    file_server.replacement = (new, '"v2"')
+
+    path = download_service.download_file(file_server.url(), tmp_path)
+
+    # If-Range carried the old ETag, so the server sent the new file whole.
+    assert file_server.requests[1]["If-Range"] == '"v1"'
+    assert path.read_bytes() == new
+
+
+def test_416_with_complete_partial_file_is_done(file_server, tmp_path):
+    file_server.data = _payload(64 * 1024)
+    resume = download_service._ResumeState()
+    resume.dest_path = tmp_path / "game.iso"
+    resume.dest_path.write_bytes(file_server.data)
+
+    path = download_service._attempt_download(
+        file_server.url(), tmp_path, None, None, None, resume
+    )
+
+    assert path == resume.dest_path
+    assert path.read_bytes() == file_server.data
+    assert file_server.requests[0]["Range"] == f"bytes={len(file_server.data)}-"
+
+
+def test_416_with_oversized_partial_file_starts_over(file_server, tmp_path):
+    file_server.data = _payload(64 * 1024)
+    resume = download_service._ResumeState()
+    resume.dest_path = tmp_path / "game.iso"
+    resume.dest_path.write_bytes(file_server.data + b"stale tail")
+
+    with pytest.raises(DownloadError):
+        download_service._attempt_download(
+            file_server.url(), tmp_path, None, None, None, resume
+        )
+    assert not resume.dest_path.exists()
+
+    path = download_service._attempt_download(
+        file_server.url(), tmp_path, None, None, None, resume
+    )
+    assert path.read_bytes() == file_server.data
+    assert "Range" not in file_server.requests[1]
+
+
+def test_stream_download_restarts_after_dropped_connection(file_server, tmp_path):
+    file_server.data = _payload(1024 * 1024)
+    file_server.drop_after = 300_000
+    retries = []
+
+    body = download_service.stream_download(
+        file_server.url(), lambda stream: stream.read(), on_retry=lambda: retries.append(1)
+    )
+
+    assert body == file_server.data
+    assert retries == [1]
+    assert all("Range" not in r for r in file_server.requests)
+
+
+def test_stream_download_without_on_retry_fails_on_drop(file_server):
+    file_server.data = _payload(1024 * 1024)
+    file_server.drop_after = 300_000
+
+    with pytest.raises(DownloadError):
+        download_service.stream_download(file_server.url(), lambda stream: stream.read())
+    assert len(file_server.requests) == 1
+
+
+def test_streamed_tar_extraction_survives_dropped_connection(file_server, tmp_path):
+    iso = _payload(512 * 1024)
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        info = tarfile.TarInfo("Game/game.iso")
+        info.size = len(iso)
+        tf.addfile(info, io.BytesIO(iso))
+    file_server.data = buf.getvalue()
+    file_server.drop_after = len(file_server.data) // 2
+    url = file_server.url("game.tar.gz")
+    dest = tmp_path / "extracted"
+
+    download_service.stream_download(
+        url,
+        lambda stream: extraction_service.extract_stream(stream, dest, url),
+        on_retry=lambda: shutil.rmtree(dest, ignore_errors=True),
+    )
+
+    assert (dest / "Game" / "game.iso").read_bytes() == iso
+    assert len(file_server.requests) == 2
+
+
+def test_streamed_iso_xz_survives_dropped_connection(file_server, tmp_path):
+    iso = os.urandom(512 * 1024)
+    file_server.data = lzma.compress(iso)
+    file_server.drop_after = len(file_server.data) // 2
+    url = file_server.url("game.iso.xz")
+    dest = tmp_path / "extracted"
+
+    download_service.stream_download(
+        url,
+        lambda stream: extraction_service.extract_stream(stream, dest, url),
+        on_retry=lambda: shutil.rmtree(dest, ignore_errors=True),
+    )
+
+    assert (dest / "game.iso").read_bytes() == iso
+    assert len(file_server.requests) == 2
+
+
+def test_resume_adopts_validator_of_restarted_download(file_server, tmp_path):
+    file_server.data = _payload(1024 * 1024)
+    file_server.drop_after = [300_000, 400_000]
+    file_server.replacement = (_payload(1024 * 1024), '"v2"')
+
+    path = download_service.download_file(file_server.url(), tmp_path)
+
+    # The second response restarted with the v2 file; the third resumes it.
+    _, second, third = file_server.requests
+    assert second["If-Range"] == '"v1"'
+    assert third["If-Range"] == '"v2"'
+    assert third["Range"] == "bytes=400000-"
+    assert path.read_bytes() == file_server.data
+
+
+def test_resume_at_wrong_offset_starts_over(file_server, tmp_path):
+    file_server.data = _payload(1024 * 1024)
+    file_server.drop_after = 300_000
+    file_server.range_shift = 1000
+
+    path = download_service.download_file(file_server.url(), tmp_path)
+
+    assert path.read_bytes() == file_server.data
+    assert file_server.requests[1]["Range"] == "bytes=300000-"
+    assert "Range" not in file_server.requests[2]
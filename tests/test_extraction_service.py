@@ -0,0 +1,242 @@
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from services import extraction_service
+from services.exceptions import DownloadError, ExtractionError
+from services.extraction_service import _make_checker
+
+
+@pytest.fixture
+def dest(tmp_path):
+    d = tmp_path / "dest"
+    d.mkdir()
+    return d
+
+
+@pytest.mark.parametrize("resolve_links", [False, True])
+@pytest.mark.parametrize(
+    "name",
+    ["../evil.iso", "a/../../evil.iso", "..\\evil.iso", "a\\..\\..\\evil.iso", ".."],
+)
+def test_checker_rejects_parent_traversal(dest, name, resolve_links):
+    assert _make_checker(dest, resolve_links)(name) is None
+
+
+@pytest.mark.parametrize("resolve_links", [False, True])
+@pytest.mark.parametrize(
+    "name",
+    ["/etc/passwd", "\\Windows\\evil.dll", "C:/evil.iso", "c:evil.iso", "\\\\server\\share\\x"],
+)
+def test_checker_rejects_absolute_paths(dest, name, resolve_links):
+    assert _make_checker(dest, resolve_links)(name) is None
+
+
+@pytest.mark.parametrize("resolve_links", [False, True])
+def test_checker_rejects_sibling_prefix_directory(dest, resolve_links):
+    # "dest2" starts with "dest" but is outside it.
+    (dest.parent / "dest2").mkdir()
+    assert _make_checker(dest, resolve_links)("../dest2/evil.iso") is None
+
+
+@pytest.mark.parametrize("resolve_links", [False, True])
+def test_checker_accepts_names_inside_dest(dest, resolve_links):
+    check = _make_checker(dest, resolve_links)
+    root = os.path.realpath(dest)
+    assert check("Game/Disc 1.iso") == Path(root, "Game", "Disc 1.iso")
+    assert check("Game\\..\\game.iso") == Path(root, "game.iso")
+    assert check("..game.iso") == Path(root, "..game.iso")
+
+
+def test_checker_resolves_existing_symlinks(dest, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    try:
+        (dest / "link").symlink_to(outside, target_is_directory=True)
+        (dest / "inner").symlink_to(dest / ".", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    check = _make_checker(dest, resolve_links=True)
+    assert check("link/evil.iso") is None
+    assert check("inner/game.iso") == Path(os.path.realpath(dest), "game.iso")
+
+
+def test_zip_with_traversal_member_is_rejected(dest, tmp_path):
+    archive = tmp_path / "bad.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("game.iso", b"iso")
+        zf.writestr("../evil.txt", b"x")
+
+    with pytest.raises(ExtractionError):
+        extraction_service.extract(archive, dest)
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_tar_fallback_rejects_member_through_symlink(dest, tmp_path, monkeypatch):
+    monkeypatch.setattr(extraction_service, "_HAS_TAR_FILTERS", False)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    archive = tmp_path / "bad.tar"
+    with tarfile.open(archive, "w") as tf:
+        link = tarfile.TarInfo("link")
+        link.type = tarfile.SYMTYPE
+        link.linkname = str(outside)
+        tf.addfile(link)
+        evil = tarfile.TarInfo("link/evil.txt")
+        evil.size = 1
+        tf.addfile(evil, io.BytesIO(b"x"))
+
+    with pytest.raises(ExtractionError):
+        extraction_service.extract(archive, dest)
+    assert not (outside / "evil.txt").exists()
+
+
+def _tar_gz(members) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class _CancellingStream(io.RawIOBase):
+    """Sequential reader that fails like a cancelled download after *limit* bytes."""
+
+    def __init__(self, data: bytes, limit: int) -> None:
+        self._data = io.BytesIO(data)
+        self._limit = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        if self._data.tell() >= self._limit:
+            raise DownloadError("Download cancelled by user.")
+        return self._data.readinto(memoryview(buf)[: self._limit - self._data.tell()])
+
+
+def test_extract_stream_tar_gz(dest):
+    iso = os.urandom(64 * 1024)
+    data = _tar_gz({"Game/Disc 1.iso": iso, "Game/readme.txt": b"hi"})
+
+    extraction_service.extract_stream(io.BytesIO(data), dest, "http://h/a/Game.tar.gz?x=1")
+
+    assert (dest / "Game" / "Disc 1.iso").read_bytes() == iso
+    assert (dest / "Game" / "readme.txt").read_bytes() == b"hi"
+
+
+def test_extract_stream_iso_xz(dest):
+    iso = os.urandom(64 * 1024)
+
+    extraction_service.extract_stream(
+        io.BytesIO(lzma.compress(iso)), dest, "http://h/Halo%203.iso.xz"
+    )
+
+    assert (dest / "Halo 3.iso").read_bytes() == iso
+
+
+@pytest.mark.parametrize("name", ["game.tar.gz", "game.iso.xz", "game.iso.gz"])
+def test_extract_stream_truncated(dest, name):
+    payload = os.urandom(64 * 1024)
+    if name.endswith(".tar.gz"):
+        data = _tar_gz({"game.iso": payload})
+    elif name.endswith(".xz"):
+        data = lzma.compress(payload)
+    else:
+        data = gzip.compress(payload)
+
+    with pytest.raises(ExtractionError):
+        extraction_service.extract_stream(io.BytesIO(data[: len(data) // 2]), dest, name)
+
+
+@pytest.mark.parametrize("name", ["game.tar.gz", "game.iso.xz"])
+def test_extract_stream_cancel_propagates(dest, name):
+    payload = os.urandom(256 * 1024)
+    data = _tar_gz({"game.iso": payload}) if name.endswith(".tar.gz") else lzma.compress(payload)
+    stream = io.BufferedReader(_CancellingStream(data, len(data) // 2), 16 * 1024)
+
+    with pytest.raises(DownloadError, match="cancelled"):
+        extraction_service.extract_stream(stream, dest, name)
+
+
+def _zip(path: Path, members, compression=zipfile.ZIP_DEFLATED) -> Path:
+    with zipfile.ZipFile(path, "w", compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def _members(count: int):
+    return {f"Game/Disc {i % 3}/file{i}.bin": os.urandom(8 * 1024) for i in range(count)}
+
+
+@pytest.fixture
+def zip_workers(monkeypatch):
+    # The thread cap follows the CPU count; don't let a small runner force
+    # the serial path.
+    monkeypatch.setattr(extraction_service, "ZIP_EXTRACT_WORKERS", 4)
+
+
+def test_zip_members_extract_on_several_threads(dest, tmp_path, monkeypatch, zip_workers):
+    members = _members(20)
+    archive = _zip(tmp_path / "game.zip", members)
+    real_extract = zipfile.ZipFile.extract
+    names = []
+    # The first two members wait for each other, so one thread alone would
+    # break the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def extract(self, member, path=None, pwd=None):
+        names.append(threading.current_thread().name)
+        if len(names) <= 2:
+            barrier.wait()
+        return real_extract(self, member, path, pwd)
+
+    monkeypatch.setattr(zipfile.ZipFile, "extract", extract)
+    extraction_service.extract(archive, dest, threads=2)
+
+    assert len(set(names)) == 2
+    for name, data in members.items():
+        assert (dest / name).read_bytes() == data
+
+
+def test_zip_extraction_stops_when_cancelled(dest, tmp_path, monkeypatch, zip_workers):
+    archive = _zip(tmp_path / "game.zip", _members(50))
+    cancel = threading.Event()
+    real_extract = zipfile.ZipFile.extract
+    extracted = []
+
+    def extract(self, member, path=None, pwd=None):
+        extracted.append(member)
+        cancel.set()  # the user cancels while the first members unpack
+        return real_extract(self, member, path, pwd)
+
+    monkeypatch.setattr(zipfile.ZipFile, "extract", extract)
+    with pytest.raises(ExtractionError, match="cancelled"):
+        extraction_service.extract(archive, dest, threads=2, cancel_event=cancel)
+
+    # Only members already running when the cancel arrived finish.
+    assert 1 <= len(extracted) <= 2
+
+
+def test_zip_with_corrupt_member_raises(dest, tmp_path, zip_workers):
+    members = _members(8)
+    archive = _zip(tmp_path / "game.zip", members, zipfile.ZIP_STORED)
+    raw = bytearray(archive.read_bytes())
+    # Flip a byte inside the stored data of one member: its CRC no longer matches.
+    offset = raw.index(members["Game/Disc 2/file5.bin"][:64])
+    raw[offset + 100] ^= 0xFF
+    archive.write_bytes(bytes(raw))
+
+    with pytest.raises(ExtractionError, match="Corrupt"):
+        extraction_service.extract(archive, dest, threads=4)
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from workers.install_worker import _disc_output_dir, _find_isos, _safe_folder_name
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+
+
+def test_find_isos_returns_discs_in_name_order(tmp_path):
+    for name in ["Game/Disc 2.iso", "Game/Disc 1.iso", "Game/readme.txt",
+                 "Game/Extras/cover.jpg", "Other/DISC.ISO", "a.iso"]:
+        _touch(tmp_path / name)
+
+    found = [p.relative_to(tmp_path).as_posix() for p in _find_isos(tmp_path)]
+
+    assert found == ["Game/Disc 1.iso", "Game/Disc 2.iso", "Other/DISC.ISO", "a.iso"]
+
+
+def test_find_isos_ignores_directories_named_like_isos(tmp_path):
+    (tmp_path / "folder.iso").mkdir()
+    _touch(tmp_path / "folder.iso" / "game.iso")
+
+    assert _find_isos(tmp_path) == [tmp_path / "folder.iso" / "game.iso"]
+
+
+def test_find_isos_empty(tmp_path):
+    _touch(tmp_path / "game.bin")
+    assert _find_isos(tmp_path) == []
+
+
+@pytest.mark.parametrize("fmt", ["XEX", "GOD"])
+def test_single_disc_converts_into_output_dir(tmp_path, fmt):
+    assert _disc_output_dir(tmp_path, Path("x/Disc 1.iso"), fmt, 1, "Game") == tmp_path
+
+
+def test_multi_disc_god_shares_output_dir(tmp_path):
+    assert _disc_output_dir(tmp_path, Path("x/Disc 2.iso"), "GOD", 2, "Game") == tmp_path
+
+
+def test_multi_disc_xex_gets_per_disc_folder_under_game(tmp_path):
+    out = _disc_output_dir(tmp_path, Path("x/Disc 2.iso"), "XEX", 2, "Halo 3: ODST")
+    assert out == tmp_path / "Halo 3_ ODST" / "Disc 2"
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ('Halo 3: ODST', "Halo 3_ ODST"),
+        ('a<b>c"d/e\\f|g?h*i', "a_b_c_d_e_f_g_h_i"),
+        ("Tab\there", "Tab_here"),
+        ("Trailing dots... ", "Trailing dots"),
+        ("  Padded  ", "Padded"),
+    ],
+)
+def test_safe_folder_name_sanitizes(name, expected):
+    assert _safe_folder_name(name, Path("Set/Disc 1.iso")) == expected
+
+
+@pytest.mark.parametrize("name", ["", "...", " . . ", "   "])
+def test_safe_folder_name_falls_back_to_iso_folder(name):
+    assert _safe_folder_name(name, Path("extracted/Set/Disc 1.iso")) == "Set"
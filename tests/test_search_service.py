@@ -0,0 +1,142 @@
+from collections import OrderedDict
+
+import pytest
+
+from models.game_entry import GameEntry
+from services import search_service
+
+BASE_URL = "https://example.org/files/Xbox%20360/"
+
+# A directory listing like the real catalogue: a header row without links,
+# a parent-directory row, nested markup, entities and a short row.
+CATALOGUE_HTML = """<!DOCTYPE html>
+<html><head><title>Index of /Xbox 360/</title></head>
+<body>
+<h1>Index of /Xbox 360/</h1>
+<table id="list">
+  <thead><tr><th>File Name</th><th>File Size</th><th>Date</th></tr></thead>
+  <tbody>
+    <tr><td><a href="../">Parent directory/</a></td><td>-</td><td>-</td></tr>
+    <tr>
+      <td class="link"><a href="Halo%203%20(USA).zip" title="Halo 3">Halo 3 (USA).zip</a></td>
+      <td class="size">USA</td><td class="size">6.9 GiB</td>
+    </tr>
+    <tr><td><a href="Forza%20Motorsport%204.zip"><b>Forza</b> Motorsport&nbsp;4</a></td>
+        <td> Europe </td><td>7.8 GiB</td></tr>
+    <tr><td><a href="https://cdn.example.org/Pok%C3%A9.zip">Pokémon &amp; Friends</a></td></tr>
+    <tr><td><a href="">No link</a></td><td>USA</td><td>1 GiB</td></tr>
+    <tr><td>No anchor at all</td><td>USA</td><td>1 GiB</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+# No rows at all: only the fallback link harvest finds anything.
+LINKS_ONLY_HTML = """<html><body>
+<ul>
+  <li><a href="/games/halo-3">Halo 3</a></li>
+  <li><a href="/about">About</a></li>
+  <li><a href="https://example.org/xbox/gears-of-war"> Gears of <i>War</i> </a></li>
+  <li><a href="/games/untitled"></a></li>
+</ul>
+</body></html>
+"""
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("html", [CATALOGUE_HTML, LINKS_ONLY_HTML])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_stream_parse_matches_beautifulsoup(html, chunk_size):
+    expected = search_service._parse_catalogue(html, BASE_URL)
+
+    entries = search_service._stream_parse_catalogue(
+        _chunks(html.encode("utf-8"), chunk_size), BASE_URL, "utf-8"
+    )
+
+    assert entries == expected
+    assert entries
+
+
+def test_structured_parse_fields():
+    entries = search_service._parse_catalogue(CATALOGUE_HTML, BASE_URL)
+
+    assert entries == [
+        GameEntry("Parent directory/", "https://example.org/files/", "-", "-"),
+        GameEntry(
+            "Halo 3 (USA).zip", BASE_URL + "Halo%203%20(USA).zip", "USA", "6.9 GiB"
+        ),
+        GameEntry(
+            "ForzaMotorsport\xa04", BASE_URL + "Forza%20Motorsport%204.zip", "Europe", "7.8 GiB"
+        ),
+        GameEntry("Pokémon & Friends", "https://cdn.example.org/Pok%C3%A9.zip"),
+    ]
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_fetch_catalogue_with_and_without_lxml(file_server, monkeypatch, streaming):
+    file_server.data = CATALOGUE_HTML.encode("utf-8")
+    monkeypatch.setattr(search_service, "CATALOGUE_URL", file_server.url("Xbox%20360/"))
+    if not streaming:
+        # What an install without lxml does: buffer the page, parse with bs4.
+        monkeypatch.setattr(search_service, "_etree", None)
+        monkeypatch.setattr(search_service, "HTML_PARSER", "html.parser")
+    assert search_service._can_stream_parse() is streaming
+
+    try:
+        entries = search_service.fetch_catalogue()
+    finally:
+        search_service.close_client()
+
+    assert [e.title for e in entries] == [
+        "Parent directory/", "Halo 3 (USA).zip", "ForzaMotorsport\xa04", "Pokémon & Friends",
+    ]
+    assert entries[1].detail_url == file_server.url("Xbox%20360/Halo%203%20(USA).zip")
+
+
+DETAIL_HTML = """<html><body>
+<a href="/about">About</a>
+<a href="Halo%203%20(USA).zip">Halo 3 (USA).zip</a>
+<a href="https://mirror.example.org/halo3.iso">Mirror 2</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def detail_server(file_server, monkeypatch):
+    file_server.data = DETAIL_HTML.encode("utf-8")
+    monkeypatch.setattr(search_service, "_mirror_cache", OrderedDict())
+    yield file_server
+    search_service.close_client()
+
+
+def _game(server, name: str) -> GameEntry:
+    return GameEntry(title=name, detail_url=server.url(f"games/{name}"))
+
+
+def test_fetch_mirrors_reuses_cached_page(detail_server):
+    game = _game(detail_server, "halo3")
+
+    first = search_service.fetch_mirrors(game)
+    again = search_service.fetch_mirrors(game)
+
+    assert [m.url for m in first] == [
+        detail_server.url("games/Halo%203%20(USA).zip"),
+        "https://mirror.example.org/halo3.iso",
+    ]
+    assert again == first
+    assert len(detail_server.requests) == 1
+
+
+def test_mirror_cache_drops_least_recently_used(detail_server, monkeypatch):
+    monkeypatch.setattr(search_service, "MIRROR_CACHE_SIZE", 2)
+    a, b, c = (_game(detail_server, name) for name in "abc")
+
+    for game in (a, b, a, c):  # touching "a" again makes "b" the oldest
+        search_service.fetch_mirrors(game)
+
+    assert list(search_service._mirror_cache) == [a.detail_url, c.detail_url]
+    search_service.fetch_mirrors(b)
+    assert len(detail_server.requests) == 4
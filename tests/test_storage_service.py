@@ -0,0 +1,165 @@
+import errno
+import os
+import shutil
+import threading
+import types
+
+import pytest
+
+from services import storage_service
+from services.exceptions import InsufficientDiskSpaceError, StorageError
+
+
+def _cross_device(src, dst):
+    raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+
+@pytest.fixture
+def converted(tmp_path):
+    src = tmp_path / "converted"
+    (src / "Game" / "Content").mkdir(parents=True)
+    (src / "Game" / "Content" / "data.bin").write_bytes(b"new")
+    return src
+
+
+def test_install_renames_on_same_volume(converted, tmp_path):
+    target = storage_service.install(converted, tmp_path / "install")
+
+    assert target == tmp_path / "install" / "Game"
+    assert (target / "Content" / "data.bin").read_bytes() == b"new"
+    assert not (converted / "Game").exists()
+
+
+def test_install_falls_back_to_copy_across_devices(converted, tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_service.os, "replace", _cross_device)
+    old = tmp_path / "install" / "Game"
+    (old / "Stale").mkdir(parents=True)
+
+    target = storage_service.install(converted, tmp_path / "install")
+
+    assert (target / "Content" / "data.bin").read_bytes() == b"new"
+    assert not (target / "Stale").exists()
+    assert not (converted / "Game").exists()
+
+
+def test_move_file_across_devices_replaces_existing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_service.os, "replace", _cross_device)
+    src, dst = tmp_path / "a.iso", tmp_path / "b.iso"
+    src.write_bytes(b"new")
+    dst.write_bytes(b"old")
+
+    storage_service._move(src, dst)
+
+    assert dst.read_bytes() == b"new"
+    assert not src.exists()
+
+
+def test_move_errors_other_than_exdev_are_raised(converted, tmp_path, monkeypatch):
+    def denied(src, dst):
+        raise PermissionError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(storage_service.os, "replace", denied)
+    monkeypatch.setattr(storage_service.shutil, "move", pytest.fail)
+
+    with pytest.raises(StorageError):
+        storage_service.install(converted, tmp_path / "install")
+
+
+@pytest.fixture
+def cleanup_executor(monkeypatch):
+    # A fresh executor, so shutting it down doesn't affect other tests.
+    monkeypatch.setattr(storage_service, "_cleanup_executor", None)
+    yield storage_service._get_cleanup_executor
+    if storage_service._cleanup_executor is not None:
+        storage_service._cleanup_executor.shutdown(wait=True)
+
+
+def test_cleanup_runs_in_background_and_finishes_on_shutdown(cleanup_executor, tmp_path):
+    release = threading.Event()
+    cleanup_executor().submit(release.wait, 5)  # keep the cleanup thread busy
+    dirs = []
+    for i in range(3):
+        d = tmp_path / f".romtool_{i}"
+        (d / "extracted").mkdir(parents=True)
+        (d / "extracted" / "game.iso").write_bytes(b"x" * 1024)
+        dirs.append(d)
+    single = tmp_path / "game.iso"
+    single.write_bytes(b"x")
+
+    for d in dirs:
+        storage_service.cleanup_temp(d)
+    storage_service.cleanup_temp(single)
+    # cleanup_temp() returned without removing anything itself.
+    assert all(d.exists() for d in dirs) and single.exists()
+
+    release.set()
+    # What the atexit hook does: wait for every queued removal.
+    cleanup_executor().shutdown(wait=True)
+    assert not any(d.exists() for d in dirs)
+    assert not single.exists()
+
+
+def test_cleanup_failure_is_logged_not_raised(cleanup_executor, tmp_path, monkeypatch, caplog):
+    d = tmp_path / ".romtool_x"
+    d.mkdir()
+
+    def fail(path):
+        raise OSError(errno.EBUSY, "Device or resource busy")
+
+    monkeypatch.setattr(storage_service.shutil, "rmtree", fail)
+    storage_service.cleanup_temp(d)
+    cleanup_executor().shutdown(wait=True)
+
+    assert "Could not remove temp directory" in caplog.text
+
+
+@pytest.fixture
+def fake_disk(monkeypatch, tmp_path):
+    clock = types.SimpleNamespace(now=1000.0)
+    disk = types.SimpleNamespace(free=10 * 1024**3, calls=0)
+
+    def disk_usage(path):
+        disk.calls += 1
+        return shutil._ntuple_diskusage(100 * 1024**3, 0, disk.free)
+
+    monkeypatch.setattr(storage_service, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(storage_service.shutil, "disk_usage", disk_usage)
+    storage_service._disk_usage_cached.cache_clear()
+    yield clock, disk
+    storage_service._disk_usage_cached.cache_clear()
+
+
+def test_disk_usage_is_reused_within_ttl(fake_disk, tmp_path):
+    clock, disk = fake_disk
+
+    storage_service.check_disk_space(tmp_path, 1024)
+    clock.now += storage_service.DISK_USAGE_TTL / 4
+    storage_service.check_disk_space(tmp_path, 1024)
+
+    assert disk.calls == 1
+
+
+def test_disk_usage_is_read_again_after_ttl(fake_disk, tmp_path):
+    clock, disk = fake_disk
+    storage_service.check_disk_space(tmp_path, 1024**3)
+
+    disk.free = 1024**3  # another install filled the drive
+    storage_service.check_disk_space(tmp_path, 1024**3)  # still the cached reading
+    clock.now += storage_service.DISK_USAGE_TTL
+
+    with pytest.raises(InsufficientDiskSpaceError):
+        storage_service.check_disk_space(tmp_path, 1024**3)
+    assert disk.calls == 2
+
+
+def test_disk_check_probes_nearest_existing_ancestor(fake_disk, tmp_path, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        storage_service.shutil,
+        "disk_usage",
+        lambda path: seen.append(path) or shutil._ntuple_diskusage(1, 0, 10 * 1024**3),
+    )
+
+    storage_service.check_disk_space(tmp_path / "not" / "yet" / "created", 1024)
+
+    assert seen == [os.path.abspath(tmp_path)]
@@ -1,25 +1,38 @@
 """
-workers/install_worker.py – Background QThread worker that orchestrates the
+workers/install_worker.py – Background QRunnable job that orchestrates the
 full download → extract → convert → install pipeline.
 
-Signal contract
----------------
+Jobs are queued on a QThreadPool owned by the main window, so installing N
+games reuses one pool thread instead of spawning N QThreads.
+
+Signal contract (on InstallWorker.signals)
+------------------------------------------
   progress(int, int)   : (bytes_done, bytes_total)  — for the progress bar
-  status(str)          : Human-readable status message — for the log area
+  stage(dict)          : {"stage", "pct", "msg"} when the pipeline moves on
+                         to a new step, and as the converter reports progress
+                         — for the stage label and the log area
+  status(str)          : Other human-readable notes — for the log area
   finished(str)        : Install path on success
   error(str)           : User-friendly error message on failure
+  done()               : Emitted last, after either finished or error
 
 The worker intentionally keeps all service calls inside try/except blocks so
 that a single failure emits error() rather than crashing the entire thread.
-Temp files are preserved on failure for manual recovery.
+The working directory is removed whether the job succeeds, fails or is
+cancelled: it lives inside the user's install folder, and a partial download
+can't be resumed by a later job anyway.
 """
 
+import logging
+import os
+import re
+import shutil
 import tempfile
-import uuid
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from models.game_entry import MirrorLink
 from services import (
@@ -29,6 +42,7 @@ from services import (
     storage_service,
 )
 from services.conversion_service import ConversionFormat
+from services.download_profiles import get_profile
 from services.exceptions import (
     DownloadError,
     ExtractionError,
@@ -42,19 +56,40 @@ from services.exceptions import (
 # Default to 9 GiB (maximum single-layer DVD9 ISO + conversion overhead).
 FALLBACK_SIZE_ESTIMATE: int = 9 * 1024 ** 3
 
+# Pipeline steps in order; a stage event's "pct" is its position in this list
+# (overall progress), advanced within the convert step as the converter reports.
+STAGES = ("prepare", "download", "extract", "convert", "install")
 
-class InstallWorker(QThread):
-    """
-    Runs the full install pipeline on a background thread.
+_logger = logging.getLogger(__name__)
 
-    Instantiate, connect signals, then call start().
-    """
 
-    # ── Signals ───────────────────────────────────────────────────────────────
+class InstallWorkerSignals(QObject):
+    """Signals for InstallWorker (QRunnable is not a QObject)."""
+
     progress = Signal(float, float)    # (downloaded_bytes, total_bytes)
+    stage    = Signal(dict)        # {"stage", "pct", "msg"} on each new step
     status   = Signal(str)         # status log message
     finished = Signal(str)         # absolute install path
     error    = Signal(str)         # user-facing error message
+    done     = Signal()            # job over (after finished or error)
+
+
+class InstallWorker(QRunnable):
+    """
+    Runs the full install pipeline on a QThreadPool thread.
+
+    Instantiate, connect ``signals``, then hand it to QThreadPool.start().
+    """
+
+    # User-facing error prefix per failure type (InsufficientDiskSpaceError
+    # is formatted separately).
+    _ERROR_TEMPLATES = {
+        DownloadError:   "Download failed:\n{}",
+        ExtractionError: "Extraction failed:\n{}",
+        ConversionError: "Conversion failed:\n{}",
+        StorageError:    "Storage error:\n{}",
+        ROMToolError:    "Error:\n{}",
+    }
 
     def __init__(
         self,
@@ -62,36 +97,37 @@ class InstallWorker(QThread):
         install_dir: Path,
         fmt: ConversionFormat,
         profile: str = "aggressive",
-        parent=None,
     ) -> None:
-        super().__init__(parent)
+        super().__init__()
+        # The window keeps a reference while queued; don't let Qt delete the
+        # C++ side out from under the Python wrapper.
+        self.setAutoDelete(False)
+        self.signals      = InstallWorkerSignals()
+        self.progress     = self.signals.progress
+        self.stage        = self.signals.stage
+        self.status       = self.signals.status
+        self.finished     = self.signals.finished
+        self.error        = self.signals.error
+        self.done         = self.signals.done
         self._mirror      = mirror
         self._install_dir = install_dir
         self._fmt         = fmt
         self._profile     = profile
         self._temp_dir: Optional[Path] = None
-        import threading
         self._cancelled = False
         self._paused = False
         self._cancel_event = threading.Event()
+        self._stage_msg = ""
+        self._disc = (0, 1)  # (index, count) of the disc being converted
 
-    def run(self):
-        try:
-            # ...
-            # Chamada do serviço de download
-            # ...
-            downloaded_file = download_service.download(
-                url=self.url,
-                dest_dir=self.dest_dir,
-                progress_callback=self.progress_callback,
-                profile=self.profile,
-                cancel_event=getattr(self, '_cancel_event', None),
-            )
-            # ...
-        except Exception as e:
-            # TODO: handle/log exception if needed
-            pass
-        """Main pipeline executed on the worker thread."""
+    def cancel(self) -> None:
+        """Ask the running download to stop at the next chunk boundary."""
+        self._cancelled = True
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """Main pipeline executed on the pool thread."""
+        self._enter_stage("prepare", f"Installing: {self._mirror.label}")
         try:
             self._run_pipeline()
         except InsufficientDiskSpaceError as exc:
@@ -100,104 +136,227 @@ class InstallWorker(QThread):
                 f"Required: {exc.required_bytes / 1024**3:.1f} GiB  |  "
                 f"Available: {exc.available_bytes / 1024**3:.1f} GiB"
             )
-        except DownloadError as exc:
-            self.error.emit(f"Download failed:\n{exc}")
-        except ExtractionError as exc:
-            self.error.emit(f"Extraction failed:\n{exc}")
-        except ConversionError as exc:
-            self.error.emit(f"Conversion failed:\n{exc}")
-        except StorageError as exc:
-            self.error.emit(f"Storage error:\n{exc}")
         except ROMToolError as exc:
-            self.error.emit(f"Error:\n{exc}")
+            # Most specific template along the exception's MRO.
+            template = next(
+                self._ERROR_TEMPLATES[cls]
+                for cls in type(exc).__mro__
+                if cls in self._ERROR_TEMPLATES
+            )
+            self.error.emit(template.format(exc))
         except Exception as exc:  # noqa: BLE001
             # Catch-all so the worker thread never silently dies.
             self.error.emit(f"Unexpected error:\n{type(exc).__name__}: {exc}")
+        finally:
+            if self._temp_dir is not None:
+                storage_service.cleanup_temp(self._temp_dir)
+            self.done.emit()
 
     # ── Pipeline steps ────────────────────────────────────────────────────────
 
     def _run_pipeline(self) -> None:
-        # ── 1. Create isolated temp directory ─────────────────────────────
-        self._temp_dir = Path(tempfile.gettempdir()) / f"romtool_{uuid.uuid4().hex}"
-        self._temp_dir.mkdir(parents=True, exist_ok=True)
-        self.status.emit(f"Working directory: {self._temp_dir}")
-
-        # ── 2. Validate disk space ─────────────────────────────────────────
-        self.status.emit("Checking available disk space…")
+        # ── 1. Validate disk space ─────────────────────────────────────────
         storage_service.check_disk_space(
             self._install_dir,
             required_bytes=FALLBACK_SIZE_ESTIMATE,
         )
-        self.status.emit("Disk space OK.")
+
+        # ── 2. Create isolated temp directory ─────────────────────────────
+        # A hidden sibling of the install target rather than the system temp
+        # dir: same filesystem, so the final install is a rename, not a copy.
+        # mkdtemp creates it atomically (O_EXCL-style) with 0o700 permissions.
+        self._install_dir.mkdir(parents=True, exist_ok=True)
+        self._temp_dir = Path(tempfile.mkdtemp(prefix=".romtool_", dir=self._install_dir))
+        _logger.debug("Working directory: %s", self._temp_dir)
 
         # ── 3. Download ────────────────────────────────────────────────────
-        self.status.emit(f"Downloading from: {self._mirror.url}")
-        download_path = download_service.download_file(
-            url=self._mirror.url,
-            dest_dir=self._temp_dir,
-            progress_callback=self._on_download_progress,
-            cancel_event=getattr(self, '_cancel_event', None),
-        )
-        self.status.emit(f"Download complete: {download_path.name}")
-
-        # ── 4. Extract archive if necessary ───────────────────────────────
-        iso_path = download_path
-        if extraction_service.is_archive(download_path):
-            self.status.emit(f"Extracting archive: {download_path.name}")
-            extract_dir = self._temp_dir / "extracted"
-            extraction_service.extract(download_path, extract_dir)
-            # Find the .iso inside the extraction output.
-            iso_path = _find_iso(extract_dir)
-            if iso_path is None:
-                raise ExtractionError(
-                    "Extraction succeeded but no .iso file was found in the archive."
-                )
-            self.status.emit(f"ISO found: {iso_path.name}")
+        profile = get_profile(self._profile)
+        extract_dir = self._temp_dir / "extracted"
+        if extraction_service.is_streamable(self._mirror.url):
+            # TAR-family archives and compressed ISOs unpack while they
+            # download; the archive itself never touches the disk.
+            self._enter_stage(
+                "download", f"Downloading and extracting from: {self._mirror.url}"
+            )
+            download_service.stream_download(
+                self._mirror.url,
+                lambda stream: extraction_service.extract_stream(
+                    stream, extract_dir, self._mirror.url
+                ),
+                progress_callback=self._on_download_progress,
+                cancel_event=self._cancel_event,
+                on_retry=lambda: self._restart_stream(extract_dir),
+            )
+            iso_paths = self._locate_isos(extract_dir)
         else:
-            self.status.emit("File is already an ISO – skipping extraction.")
+            self._enter_stage("download", f"Downloading from: {self._mirror.url}")
+            download_path = download_service.download_file_segmented(
+                url=self._mirror.url,
+                dest_dir=self._temp_dir,
+                segments=profile["max_parts"],
+                progress_callback=self._on_download_progress,
+                cancel_event=self._cancel_event,
+            )
+            _logger.debug("Download complete: %s", download_path.name)
+
+            # ── 4. Extract archive if necessary ───────────────────────────
+            iso_paths = [download_path]
+            if extraction_service.is_archive(download_path):
+                self._enter_stage("extract", f"Extracting archive: {download_path.name}")
+                extraction_service.extract(
+                    download_path,
+                    extract_dir,
+                    threads=extraction_service.PROFILE_EXTRACT_THREADS.get(self._profile),
+                    cancel_event=self._cancel_event,
+                )
+                # The archive is no longer needed; free its space before
+                # conversion writes its own copy of the game.
+                download_path.unlink(missing_ok=True)
+                iso_paths = self._locate_isos(extract_dir)
+            else:
+                _logger.debug("File is already an ISO – skipping extraction.")
 
         # ── 5. Convert ISO ────────────────────────────────────────────────
-        self.status.emit(f"Converting ISO to {self._fmt} format…")
         convert_out_dir = self._temp_dir / "converted"
-        conversion_service.convert_iso(
-            iso_path=iso_path,
-            output_dir=convert_out_dir,
-            fmt=self._fmt,
-            progress_callback=self._on_convert_progress,
-        )
-        self.status.emit("Conversion complete.")
+        # Discs convert one after another: the pool already runs several
+        # installs at once, and GOD discs share one title ID folder.
+        for index, iso_path in enumerate(iso_paths):
+            if self._cancel_event.is_set():
+                raise ConversionError("Conversion cancelled by user.")
+            self._disc = (index, len(iso_paths))
+            self._enter_stage(
+                "convert",
+                f"Converting {iso_path.name} to {self._fmt} format…",
+                self._convert_pct(0, 1),
+            )
+            conversion_service.convert_iso(
+                iso_path=iso_path,
+                output_dir=_disc_output_dir(
+                    convert_out_dir, iso_path, self._fmt, len(iso_paths),
+                    self._mirror.label,
+                ),
+                fmt=self._fmt,
+                progress_callback=self._on_convert_progress,
+            )
+        _logger.debug("Conversion complete.")
+
+        # The source images aren't needed any more; free their space now
+        # rather than after the install.
+        for source in [extract_dir] if extract_dir.exists() else iso_paths:
+            storage_service.cleanup_temp(source)
 
         # ── 6. Install (move to destination) ──────────────────────────────
-        self.status.emit(f"Installing to: {self._install_dir}")
+        self._enter_stage("install", f"Installing to: {self._install_dir}")
         install_path = storage_service.install(convert_out_dir, self._install_dir)
-        self.status.emit(f"Installed at: {install_path}")
-
-        # ── 7. Cleanup temp directory ─────────────────────────────────────
-        self.status.emit("Cleaning up temporary files…")
-        storage_service.cleanup_temp(self._temp_dir)
-        self.status.emit("Done.")
+        storage_service.release_page_cache(install_path)
 
-        # ── 8. Emit success ───────────────────────────────────────────────
+        # ── 7. Emit success (run() removes the temp directory) ────────────
         self.finished.emit(str(install_path))
 
+    def _restart_stream(self, extract_dir: Path) -> None:
+        # The connection dropped mid-stream; the next attempt starts over, so
+        # throw away what was unpacked so far.
+        self.status.emit("Connection lost – restarting the download…")
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+    def _enter_stage(self, stage: str, msg: str, pct: Optional[int] = None) -> None:
+        self._stage_msg = msg
+        if pct is None:
+            pct = STAGES.index(stage) * 100 // len(STAGES)
+        self.stage.emit({"stage": stage, "pct": pct, "msg": msg})
+
+    def _convert_pct(self, current: int, total: int) -> int:
+        # Spread the discs over the convert step's share of the overall
+        # percentage; *current*/*total* is the converter's progress on one.
+        index, count = self._disc
+        start = STAGES.index("convert") * 100 // len(STAGES)
+        end = STAGES.index("install") * 100 // len(STAGES)
+        done = (index + (current / total if total > 0 else 0)) / count
+        return start + int(done * (end - start))
+
+    def _locate_isos(self, extract_dir: Path) -> List[Path]:
+        # Find every disc image inside the extraction output.
+        iso_paths = _find_isos(extract_dir)
+        if not iso_paths:
+            raise ExtractionError(
+                "Extraction succeeded but no .iso file was found in the archive."
+            )
+        names = ", ".join(p.name for p in iso_paths)
+        self.status.emit(f"ISO found: {names}")
+        return iso_paths
+
     # ── Callbacks (called from worker thread; emit signals thread-safely) ─────
 
     def _on_download_progress(self, downloaded: int, total: int) -> None:
+        # download_service already coalesces callbacks (PROGRESS_INTERVAL /
+        # PROGRESS_MIN_BYTES, plus a final one), so every call is forwarded.
         self.progress.emit(float(downloaded), float(total if total > 0 else 0))
 
     def _on_convert_progress(self, current: int, total: int) -> None:
-        # Conversion progress is coarse (0 or 100); map to a visual range.
-        # Download occupies 0-80 %, conversion occupies 80-100 %.
-        # The progress bar receives raw byte-like values; MainWindow interprets them.
-        pass  # Individual conversion signals emitted directly in conversion_service
+        # conversion_service only calls this when the percentage changes
+        # (at most ~100 times per disc), so every call is forwarded.
+        pct = self._convert_pct(current, total)
+        self.stage.emit({"stage": "convert", "pct": pct, "msg": self._stage_msg})
 
 
 # ── Helper ────────────────────────────────────────────────────────────────────
 
 
-def _find_iso(directory: Path) -> Optional[Path]:
-    """Recursively find the first .iso file inside *directory*."""
-    for candidate in sorted(directory.rglob("*.iso")):
-        if candidate.is_file():
-            return candidate
-    return None
+def _find_isos(directory: Path) -> List[Path]:
+    """
+    Recursively find every .iso file inside *directory*.
+
+    Multi-disc sets ship several images in one archive; they are returned
+    depth-first in name order, so "Disc 1" comes before "Disc 2".  Only
+    directories and .iso entries are kept while walking, never the whole
+    extracted tree.
+    """
+    found: List[Path] = []
+    # (path, is_dir) pairs; a file only ever gets pushed if it is an .iso.
+    stack = [(str(directory), True)]
+    while stack:
+        path, is_dir = stack.pop()
+        if not is_dir:
+            found.append(Path(path))
+            continue
+        children = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    children.append((entry.name, entry.path, True))
+                elif entry.name.lower().endswith(".iso") and entry.is_file():
+                    children.append((entry.name, entry.path, False))
+        children.sort(reverse=True)
+        stack.extend((child, child_is_dir) for _, child, child_is_dir in children)
+    return found
+
+
+# Characters Windows doesn't allow in file names, plus control characters.
+_UNSAFE_NAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def _disc_output_dir(
+    convert_out_dir: Path,
+    iso_path: Path,
+    fmt: ConversionFormat,
+    disc_count: int,
+    game_name: str,
+) -> Path:
+    """
+    Where one disc's conversion output goes.
+
+    GOD discs share a title ID folder and sit side by side under it, so they
+    go in the same directory; extracted XEX trees would overwrite each other
+    and get one sub-directory per disc, grouped under a folder named after
+    the game.  That folder is the single child storage_service.install()
+    moves into place, so each multi-disc game installs under its own name.
+    """
+    if disc_count == 1 or fmt == "GOD":
+        return convert_out_dir
+    return convert_out_dir / _safe_folder_name(game_name, iso_path) / iso_path.stem
+
+
+def _safe_folder_name(name: str, iso_path: Path) -> str:
+    """*name* usable as a Windows folder name; the ISO's folder if nothing is left."""
+    cleaned = _UNSAFE_NAME_CHARS.sub("_", name).strip().rstrip(". ")
+    return cleaned or iso_path.parent.name